@@ -2,18 +2,15 @@
 
 import argparse
 import logging
+import logging.handlers
 import sys
+import threading
+from collections.abc import Callable
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-try:
-    from importlib.metadata import version
-except ImportError:
-    from importlib_metadata import version  # type: ignore
-
-from .config import Config
-from .exceptions import ConfigurationError
-from .tui import run_app
+if TYPE_CHECKING:
+    from .config import Config
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -51,15 +48,26 @@ def setup_logging(log_level: int, log_file: Optional[Path] = None) -> None:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-
 
-def main() -> None:
-    """Main entry point for gitmon."""
-    parser = argparse.ArgumentParser(
-        description="GitMon - Git Repository Monitor TUI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+        # --verbose writes each record straight to the file, so the log can be
+        # tailed while gitmon runs. --debug already echoes records to the
+        # console, so its much chattier file output is written in small
+        # batches instead; warnings and errors flush at once, and
+        # logging.shutdown() at exit flushes whatever is still buffered.
+        if log_level == logging.DEBUG:
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=64,
+                flushLevel=logging.WARNING,
+                target=file_handler,
+                flushOnClose=True,
+            )
+            buffered_handler.setLevel(log_level)
+            root_logger.addHandler(buffered_handler)
+        else:
+            root_logger.addHandler(file_handler)
+
+
+_EPILOG = """
 Examples:
   gitmon                    Start monitoring with default config
   gitmon --config custom    Use custom config file
@@ -73,7 +81,76 @@ The config file should contain:
     "watch_directories": ["/path/to/repos", "~/code"],
     "refresh_interval": 5
   }
-        """,
+"""
+
+
+def _start_config_load(config_path: Optional[Path]) -> Callable[[], "Config"]:
+    """Start loading the configuration on a background thread.
+
+    This lets the config file I/O overlap with importing the TUI modules.
+
+    Args:
+        config_path: Explicit config file path, or None for the default location
+
+    Returns:
+        Function that waits for the load to finish and returns the Config,
+        re-raising any exception raised while loading
+    """
+    from .config import Config
+
+    loaded: list[Config] = []
+    errors: list[BaseException] = []
+
+    def load() -> None:
+        try:
+            loaded.append(Config(config_path) if config_path else Config())
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=load, name="gitmon-config-load", daemon=True)
+    thread.start()
+
+    def wait() -> Config:
+        thread.join()
+        if errors:
+            raise errors[0]
+        return loaded[0]
+
+    return wait
+
+
+class _LazyVersion(argparse.Action):
+    """Print the installed gitmon version, resolving it only when requested."""
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: Optional[str] = None,
+    ) -> None:
+        _print_version()
+        parser.exit()
+
+
+def _print_version() -> None:
+    """Print the installed gitmon version."""
+    from importlib.metadata import version
+
+    print(f"gitmon {version('gitmon')}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="gitmon",
+        description="GitMon - Git Repository Monitor TUI",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
@@ -96,9 +173,23 @@ The config file should contain:
         help="Enable debug logging to console and file (implies --verbose)",
     )
 
-    parser.add_argument("--version", action="version", version=f"gitmon {version('gitmon')}")
+    parser.add_argument(
+        "--version", nargs=0, action=_LazyVersion, help="show program's version number and exit"
+    )
+
+    return parser
 
-    args = parser.parse_args()
+
+def main() -> None:
+    """Main entry point for gitmon."""
+    # Answer the common "just print the version" invocation without building
+    # the argument parser
+    argv = sys.argv[1:]
+    if argv == ["--version"]:
+        _print_version()
+        return
+
+    args = _build_parser().parse_args(argv)
 
     # Configure logging based on arguments
     log_level = logging.WARNING  # Default: only warnings and errors
@@ -114,9 +205,17 @@ The config file should contain:
     setup_logging(log_level, log_file)
     logger.info("Starting gitmon...")
 
+    # Imported here rather than at module level so that --help/--version and
+    # argument errors don't pay for importing Textual/Rich.
+    from .exceptions import ConfigurationError
+
     try:
-        # Load configuration
-        config = Config(args.config) if args.config else Config()
+        # Load configuration in the background while the TUI modules are imported
+        wait_for_config = _start_config_load(args.config)
+
+        from .tui import run_app
+
+        config = wait_for_config()
         logger.info(f"Loaded configuration from {config.config_path}")
 
         # Run the TUI application
@@ -1,20 +1,181 @@
 """Configuration file handling for gitmon."""
 
+import contextlib
 import json
 import logging
 import os
+import stat
+import tempfile
 from pathlib import Path
-from typing import Any, Optional, cast
+from typing import Any, Optional, TypedDict
 
 from .exceptions import ConfigurationError
 
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+__all__ = ["Config"]
+
 logger = logging.getLogger(__name__)
 
 
+class _ConfigFile(TypedDict, total=False):
+    """Options as they may appear in the config file (all optional)."""
+
+    watch_directories: list[str]
+    refresh_interval: int
+    max_depth: int
+    auto_fetch_enabled: bool
+    auto_fetch_interval: int
+    fetch_parallelism: int
+
+
+class _ConfigFields(TypedDict):
+    """Complete set of configuration options."""
+
+    watch_directories: list[str]
+    refresh_interval: int
+    max_depth: int
+    auto_fetch_enabled: bool
+    auto_fetch_interval: int
+    fetch_parallelism: int
+
+
+# Values used for options missing from the config file. The default config
+# file written on first run additionally watches ~/code; that entry is built
+# on demand so importing this module doesn't look up the home directory.
+_DEFAULTS: _ConfigFields = {
+    "watch_directories": [],
+    "refresh_interval": 5,
+    "max_depth": 3,
+    "auto_fetch_enabled": False,
+    "auto_fetch_interval": 300,
+    "fetch_parallelism": 8,
+}
+
+
+def _cache_dir() -> Path:
+    """Get the directory holding gitmon's caches.
+
+    Returns:
+        Path to the cache directory, honouring $XDG_CACHE_HOME
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "gitmon"
+
+
+def _atomic_write(path: Path, data: bytes, durable: bool = True) -> None:
+    """Replace a file's contents atomically.
+
+    The data is written to a uniquely named sibling temporary file with a
+    single write call and then renamed over the target, so readers never see
+    a partial file and concurrent writers never share a temporary file.
+    Symlinks are followed, so a symlinked file is updated where it points to.
+    An existing file keeps its permission bits; a new one is readable by its
+    owner only. Missing parent directories are created.
+
+    Args:
+        path: File to write
+        data: Complete new file contents
+        durable: Whether to fsync the data before renaming it into place
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=f"{path.name}.", dir=path.parent)
+    except FileNotFoundError:
+        # The parent usually exists, so only create it once opening has failed
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", prefix=f"{path.name}.", dir=path.parent)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _validate(fields: _ConfigFields) -> None:
+    """Validate configuration values.
+
+    Args:
+        fields: Mapping of configuration option names to values
+
+    Raises:
+        ConfigurationError: If any configuration value is invalid.
+    """
+    watch_directories = fields["watch_directories"]
+    if not isinstance(watch_directories, list):
+        raise ConfigurationError(
+            f"watch_directories must be a list, got {type(watch_directories).__name__}"
+        )
+
+    refresh_interval = fields["refresh_interval"]
+    if refresh_interval < 1:
+        raise ConfigurationError(f"refresh_interval must be >= 1, got {refresh_interval}")
+
+    max_depth = fields["max_depth"]
+    if max_depth < 1:
+        raise ConfigurationError(f"max_depth must be >= 1, got {max_depth}")
+
+    auto_fetch_interval = fields["auto_fetch_interval"]
+    if auto_fetch_interval < 60:
+        raise ConfigurationError(
+            f"auto_fetch_interval must be >= 60 seconds, got {auto_fetch_interval}"
+        )
+
+    fetch_parallelism = fields["fetch_parallelism"]
+    if fetch_parallelism < 1:
+        raise ConfigurationError(f"fetch_parallelism must be >= 1, got {fetch_parallelism}")
+
+
 class Config:
     """Handle gitmon configuration."""
 
-    DEFAULT_CONFIG_PATH = Path.home() / ".config" / "gitmon" / "config.json"
+    __slots__ = (
+        "config_path",
+        "_path_str",
+        "_watch_directories",
+        "_expanded",
+        "refresh_interval",
+        "max_depth",
+        "auto_fetch_enabled",
+        "auto_fetch_interval",
+        "fetch_parallelism",
+    )
 
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize configuration handler.
@@ -22,89 +183,115 @@ class Config:
         Args:
             config_path: Path to configuration file. Defaults to ~/.config/gitmon/config.json
         """
-        self.config_path = config_path or self.DEFAULT_CONFIG_PATH
-        self.watch_directories: list[str] = []
-        self.refresh_interval: int = 5
-        self.max_depth: int = 3
-        self.auto_fetch_enabled: bool = False
-        self.auto_fetch_interval: int = 300
+        self.config_path = config_path or self._default_config_path()
+        self._path_str = os.fspath(self.config_path)
+        self._expanded: Optional[list[str]] = None
+        self.watch_directories = list(_DEFAULTS["watch_directories"])
+        self.refresh_interval: int = _DEFAULTS["refresh_interval"]
+        self.max_depth: int = _DEFAULTS["max_depth"]
+        self.auto_fetch_enabled: bool = _DEFAULTS["auto_fetch_enabled"]
+        self.auto_fetch_interval: int = _DEFAULTS["auto_fetch_interval"]
+        self.fetch_parallelism: int = _DEFAULTS["fetch_parallelism"]
         self.load()
 
+    @property
+    def watch_directories(self) -> list[str]:
+        """Directories to scan for repositories, as written in the config file."""
+        return self._watch_directories
+
+    @watch_directories.setter
+    def watch_directories(self, directories: list[str]) -> None:
+        self._watch_directories = directories
+        self._expanded = None
+
+    @classmethod
+    def _default_config_path(cls) -> Path:
+        """Get the default configuration file location.
+
+        Resolved on demand so the home directory lookup only happens when no
+        explicit path is given.
+
+        Returns:
+            Path to ~/.config/gitmon/config.json
+        """
+        return Path.home() / ".config" / "gitmon" / "config.json"
+
     def load(self) -> None:
         """Load configuration from file."""
-        if not self.config_path.exists():
+        try:
+            logger.debug(f"Loading configuration from {self.config_path}")
+            with open(self._path_str, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
             logger.info(f"Config file not found at {self.config_path}, creating default config")
             self._create_default_config()
             return
-
-        try:
-            logger.debug(f"Loading configuration from {self.config_path}")
-            with open(self.config_path) as f:
-                data: dict[str, Any] = json.load(f)
-                self.watch_directories = cast("list[str]", data.get("watch_directories", []))
-                self.refresh_interval = cast("int", data.get("refresh_interval", 5))
-                self.max_depth = cast("int", data.get("max_depth", 3))
-                self.auto_fetch_enabled = cast("bool", data.get("auto_fetch_enabled", False))
-                self.auto_fetch_interval = cast("int", data.get("auto_fetch_interval", 300))
-            logger.debug(
-                f"Successfully loaded configuration: {len(self.watch_directories)} watch directories"
-            )
         except OSError as e:
             logger.error(f"Failed to read config file {self.config_path}: {e}")
             raise ConfigurationError(f"Error reading config from {self.config_path}: {e}") from e
-        except json.JSONDecodeError as e:
+
+        try:
+            data: _ConfigFile = _loads(raw)
+            fields: _ConfigFields = {
+                "watch_directories": data.get("watch_directories", []),
+                "refresh_interval": data.get("refresh_interval", _DEFAULTS["refresh_interval"]),
+                "max_depth": data.get("max_depth", _DEFAULTS["max_depth"]),
+                "auto_fetch_enabled": data.get(
+                    "auto_fetch_enabled", _DEFAULTS["auto_fetch_enabled"]
+                ),
+                "auto_fetch_interval": data.get(
+                    "auto_fetch_interval", _DEFAULTS["auto_fetch_interval"]
+                ),
+                "fetch_parallelism": data.get("fetch_parallelism", _DEFAULTS["fetch_parallelism"]),
+            }
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error(f"Invalid JSON in config file {self.config_path}: {e}")
             raise ConfigurationError(f"Invalid JSON in config file {self.config_path}: {e}") from e
 
         # Validate configuration values
-        self._validate()
+        _validate(fields)
+        self._apply(fields)
+        logger.debug(
+            f"Successfully loaded configuration: {len(self.watch_directories)} watch directories"
+        )
 
-    def _validate(self) -> None:
-        """Validate configuration values.
+    def _apply(self, fields: _ConfigFields) -> None:
+        """Set configuration attributes from a dictionary of fields.
 
-        Raises:
-            ConfigurationError: If any configuration value is invalid.
+        Args:
+            fields: Mapping of configuration option names to values
         """
-        if not isinstance(self.watch_directories, list):
-            raise ConfigurationError(
-                f"watch_directories must be a list, got {type(self.watch_directories).__name__}"
-            )
-
-        if self.refresh_interval < 1:
-            raise ConfigurationError(f"refresh_interval must be >= 1, got {self.refresh_interval}")
+        self.watch_directories = fields["watch_directories"]
+        self.refresh_interval = fields["refresh_interval"]
+        self.max_depth = fields["max_depth"]
+        self.auto_fetch_enabled = fields["auto_fetch_enabled"]
+        self.auto_fetch_interval = fields["auto_fetch_interval"]
+        self.fetch_parallelism = fields["fetch_parallelism"]
 
-        if self.max_depth < 1:
-            raise ConfigurationError(f"max_depth must be >= 1, got {self.max_depth}")
+    def _as_dict(self) -> _ConfigFields:
+        """Get the configuration options as a dictionary.
 
-        if self.auto_fetch_interval < 60:
-            raise ConfigurationError(
-                f"auto_fetch_interval must be >= 60 seconds, got {self.auto_fetch_interval}"
-            )
+        Returns:
+            Mapping of configuration option names to values
+        """
+        return {
+            "watch_directories": self.watch_directories,
+            "refresh_interval": self.refresh_interval,
+            "max_depth": self.max_depth,
+            "auto_fetch_enabled": self.auto_fetch_enabled,
+            "auto_fetch_interval": self.auto_fetch_interval,
+            "fetch_parallelism": self.fetch_parallelism,
+        }
 
     def _create_default_config(self) -> None:
         """Create default configuration file."""
         try:
             logger.info(f"Creating default config at {self.config_path}")
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
-            default_config: dict[str, Any] = {
-                "watch_directories": [
-                    str(Path.home() / "code"),
-                ],
-                "refresh_interval": 5,
-                "max_depth": 3,
-                "auto_fetch_enabled": False,
-                "auto_fetch_interval": 300,
-            }
-
-            with open(self.config_path, "w") as f:
-                json.dump(default_config, f, indent=2)
+            default_config = _DEFAULTS.copy()
+            default_config["watch_directories"] = [str(Path.home() / "code")]
 
-            self.watch_directories = cast("list[str]", default_config["watch_directories"])
-            self.refresh_interval = cast("int", default_config["refresh_interval"])
-            self.max_depth = cast("int", default_config["max_depth"])
-            self.auto_fetch_enabled = cast("bool", default_config["auto_fetch_enabled"])
-            self.auto_fetch_interval = cast("int", default_config["auto_fetch_interval"])
+            _atomic_write(self.config_path, _dumps(default_config))
+            self._apply(default_config)
 
             logger.info("Default config created successfully")
         except (OSError, PermissionError) as e:
@@ -115,18 +302,11 @@ class Config:
         """Save configuration to file."""
         try:
             logger.debug(f"Saving configuration to {self.config_path}")
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
-            data = {
-                "watch_directories": self.watch_directories,
-                "refresh_interval": self.refresh_interval,
-                "max_depth": self.max_depth,
-                "auto_fetch_enabled": self.auto_fetch_enabled,
-                "auto_fetch_interval": self.auto_fetch_interval,
-            }
 
-            with open(self.config_path, "w") as f:
-                json.dump(data, f, indent=2)
+            data = self._as_dict()
+
+            _atomic_write(self.config_path, _dumps(data))
+            self._expanded = None
 
             logger.debug("Configuration saved successfully")
         except (OSError, PermissionError) as e:
@@ -139,10 +319,21 @@ class Config:
         Returns:
             List of Path objects with expanded paths
         """
+        # Expanding variables and ~ is done once per assignment of
+        # watch_directories rather than on every call
+        if self._expanded is None:
+            self._expanded = [
+                os.path.expandvars(os.path.expanduser(d)) if "~" in d or "$" in d else d
+                for d in self.watch_directories
+            ]
+
         expanded = []
-        for directory in self.watch_directories:
-            # Expand environment variables and user home
-            expanded_path = Path(os.path.expandvars(os.path.expanduser(directory)))
-            if expanded_path.exists() and expanded_path.is_dir():
-                expanded.append(expanded_path)
+        for directory in self._expanded:
+            # A single stat answers both "exists" and "is a directory"
+            try:
+                st = os.stat(directory)
+            except OSError:
+                continue
+            if stat.S_ISDIR(st.st_mode):
+                expanded.append(Path(directory))
         return expanded
@@ -1,27 +1,154 @@
 """Git repository scanner and information extractor."""
 
+import asyncio
+import contextlib
+import functools
+import importlib
 import logging
+import os
+import re
+import shutil
 import subprocess
-from dataclasses import dataclass
+import sys
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Protocol
+from typing import Any, Optional, Protocol, TypedDict, TypeVar, Union
+
+from .config import _atomic_write, _cache_dir, _dumps, _loads
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Maximum number of git processes run concurrently by the async scanner, in
+# the spirit of mgit's MGIT_PARALLEL default for I/O-bound git work. Fetches
+# started from the TUI use Config.fetch_parallelism instead: they open
+# connections to a handful of remote hosts, which throttle or refuse many at
+# once from one client, while scans only read local repositories.
+MAX_PARALLEL_GIT = (os.cpu_count() or 1) * 8
+
+# Threads for git work that blocks: custom runners, pygit2 and fetches. The
+# asyncio default executor is capped at 32 threads, which would silently
+# undercut MAX_PARALLEL_GIT; threads are only started as work arrives.
+_GIT_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_PARALLEL_GIT, thread_name_prefix="gitmon-git")
+
+# Commands run for each repository by get_repo_info. Porcelain v2 status with
+# --branch reports the branch name, ahead/behind counts and working tree
+# changes from a single git process.
+_STATUS_ARGS = ["git", "status", "--porcelain=v2", "--branch"]
+_REMOTE_URL_ARGS = ["git", "remote", "get-url", "origin"]
+_REMOTE_COMMIT_ARGS = ["git", "log", "origin/HEAD", "-1", "--pretty=format:%s"]
+_REPO_INFO_COMMANDS = [
+    _STATUS_ARGS,
+    _REMOTE_URL_ARGS,
+    _REMOTE_COMMIT_ARGS,
+]
+
+# Hosted remote URLs, either scp-like (git@github.com:owner/repo.git) or with a
+# scheme (https://github.com/owner/repo.git, ssh://git@host/owner/repo). The
+# repository is the last path segment. For nested namespaces (GitLab
+# subgroups) the owner of an scp-like URL is the first path segment, and that
+# of a URL with a scheme the segment just before the repository.
+_REMOTE_RE = re.compile(
+    r"^(?:[^@/:]+@[^/:]+:(?:(?P<scp_owner>[^/]+)/(?:[^/]+/)*)?"
+    r"|(?:https?|ssh|git)://[^/]+/(?:(?:[^/]+/)*(?P<owner>[^/]+)/)?)"
+    r"(?P<repo>[^/]+?)(?:\.git)?/*$"
+)
+
+# Bump whenever the layout of the repository list cache changes
+_WALK_CACHE_VERSION = 1
+
+
+class _WalkCacheEntry(TypedDict):
+    """Result of walking one watch directory, as stored in the repository list cache."""
+
+    max_depth: int
+    # st_ctime_ns of every non-repository directory visited by the walk
+    dirs: dict[str, int]
+    repos: list[str]
+
+
+# Whether directories can be listed and probed through a descriptor (POSIX)
+_SCANDIR_FD = os.scandir in os.supports_fd and os.stat in os.supports_dir_fd
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+# Fetch every remote, several at a time, pruning deleted remote branches
+_FETCH_ARGS = ["git", "fetch", "--all", "--prune", "--jobs=8"]
+
+# Never let git wait for credentials on a terminal the TUI owns
+_NO_PROMPT_ENV = {"GIT_TERMINAL_PROMPT": "0"}
+
+# Environment for the read-only queries: without optional locks, `git status`
+# neither takes index.lock nor writes the refreshed index back, so scans do
+# not contend with the user's own git commands
+_QUERY_ENV = {**_NO_PROMPT_ENV, "GIT_OPTIONAL_LOCKS": "0"}
+
+# Abort HTTP transfers that stay below 1 KB/s for 10 seconds rather than
+# letting a stalled remote use up the whole fetch timeout
+_FETCH_ENV = {
+    **_NO_PROMPT_ENV,
+    "GIT_HTTP_LOW_SPEED_LIMIT": "1000",
+    "GIT_HTTP_LOW_SPEED_TIME": "10",
+}
+
+# A git command's result, or the exception raised while running it
+_CommandOutcome = Union["subprocess.CompletedProcess[bytes]", BaseException]
+
+
+@functools.cache
+def _git_executable() -> Optional[str]:
+    """Find the absolute path of the git executable on $PATH.
+
+    Returns:
+        Path to git, or None if it is not on $PATH
+    """
+    return shutil.which("git")
+
+
+def _spawn_args(cwd: Path, args: list[str]) -> tuple[list[str], Optional[Path]]:
+    """Rewrite a git command so subprocess can start it with posix_spawn.
+
+    subprocess only uses posix_spawn instead of fork and exec when the
+    executable has a directory component, no working directory is given and
+    close_fds is off (Python opens descriptors non-inheritable anyway). The
+    working directory is therefore passed to git as -C.
+
+    Args:
+        cwd: Working directory for the command
+        args: Command arguments (including 'git')
+
+    Returns:
+        Tuple of (argv, cwd) to start the process with
+    """
+    git = _git_executable()
+    if git is None or not args or args[0] != "git":
+        return args, cwd
+    return [git, "-C", os.fspath(cwd), *args[1:]], None
+
 
 class GitCommandRunner(Protocol):
     """Protocol for running git commands (allows for test mocking)."""
 
-    def run(self, cwd: Path, args: list[str], timeout: int = 5) -> subprocess.CompletedProcess[str]:
+    def run(
+        self,
+        cwd: Path,
+        args: list[str],
+        timeout: int = 5,
+        env: Optional[dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess[bytes]:
         """Run a git command in the specified directory.
 
         Args:
             cwd: Working directory for the command
             args: Command arguments (including 'git')
             timeout: Timeout in seconds
+            env: Extra environment variables for the command
 
         Returns:
-            CompletedProcess with stdout/stderr as text
+            CompletedProcess with stdout/stderr as bytes
 
         Raises:
             subprocess.TimeoutExpired: If command times out
@@ -33,28 +160,258 @@ class GitCommandRunner(Protocol):
 class SubprocessGitRunner:
     """Default git command runner using subprocess."""
 
-    def run(self, cwd: Path, args: list[str], timeout: int = 5) -> subprocess.CompletedProcess[str]:
+    def run(
+        self,
+        cwd: Path,
+        args: list[str],
+        timeout: int = 5,
+        env: Optional[dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess[bytes]:
         """Run a git command using subprocess.
 
         Args:
             cwd: Working directory for the command
             args: Command arguments (including 'git')
             timeout: Timeout in seconds
+            env: Extra environment variables for the command
 
         Returns:
-            CompletedProcess with stdout/stderr as text
+            CompletedProcess with stdout/stderr as bytes
         """
+        argv, spawn_cwd = _spawn_args(cwd, args)
         return subprocess.run(
-            args,
-            cwd=cwd,
+            argv,
+            cwd=spawn_cwd,
+            env={**os.environ, **env} if env else None,
+            close_fds=False,
             capture_output=True,
-            text=True,
             timeout=timeout,
             check=False,  # We handle errors manually
         )
 
 
-@dataclass
+class AsyncGitCommandRunner(Protocol):
+    """Protocol for running git commands from asyncio code."""
+
+    async def run(
+        self,
+        cwd: Path,
+        args: list[str],
+        timeout: int = 5,
+        env: Optional[dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess[bytes]:
+        """Run a git command in the specified directory.
+
+        Args:
+            cwd: Working directory for the command
+            args: Command arguments (including 'git')
+            timeout: Timeout in seconds
+            env: Extra environment variables for the command
+
+        Returns:
+            CompletedProcess with stdout/stderr as bytes
+
+        Raises:
+            subprocess.TimeoutExpired: If command times out
+        """
+        ...
+
+
+class AsyncGitRunner:
+    """Default async git command runner using asyncio subprocesses."""
+
+    async def run(
+        self,
+        cwd: Path,
+        args: list[str],
+        timeout: int = 5,
+        env: Optional[dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess[bytes]:
+        """Run a git command using asyncio.create_subprocess_exec.
+
+        Args:
+            cwd: Working directory for the command
+            args: Command arguments (including 'git')
+            timeout: Timeout in seconds
+            env: Extra environment variables for the command
+
+        Returns:
+            CompletedProcess with stdout/stderr as bytes
+
+        Raises:
+            subprocess.TimeoutExpired: If command times out
+        """
+        argv, spawn_cwd = _spawn_args(cwd, args)
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=spawn_cwd,
+            env={**os.environ, **env} if env else None,
+            close_fds=False,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(args, timeout) from None
+
+        return subprocess.CompletedProcess(
+            args=args,
+            returncode=proc.returncode if proc.returncode is not None else -1,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+
+class _ThreadedGitRunner:
+    """Adapt a synchronous GitCommandRunner to the async runner protocol."""
+
+    def __init__(self, runner: GitCommandRunner):
+        """Initialize the adapter.
+
+        Args:
+            runner: Synchronous runner to call from worker threads
+        """
+        self.runner = runner
+
+    async def run(
+        self,
+        cwd: Path,
+        args: list[str],
+        timeout: int = 5,
+        env: Optional[dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess[bytes]:
+        """Run a git command on a worker thread.
+
+        Args:
+            cwd: Working directory for the command
+            args: Command arguments (including 'git')
+            timeout: Timeout in seconds
+            env: Extra environment variables for the command
+
+        Returns:
+            CompletedProcess from the wrapped runner
+        """
+        return await _in_git_thread(self.runner.run, cwd, args, timeout, env)
+
+
+async def _in_git_thread(func: Callable[..., _T], *args: Any) -> _T:
+    """Run a blocking call on the git thread pool.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for func
+
+    Returns:
+        The function's result
+    """
+    return await asyncio.get_running_loop().run_in_executor(_GIT_EXECUTOR, func, *args)
+
+
+async def _stream_status(repo_path: Path, timeout: int) -> subprocess.CompletedProcess[bytes]:
+    """Run the porcelain v2 status command, stopping git at the first entry.
+
+    Only the "# branch.*" headers and whether any entry follows them are
+    needed, so in a worktree with many changes git is killed as soon as the
+    first entry arrives instead of listing every path. Running without
+    optional locks means git holds no index lock that killing it could leave.
+
+    Args:
+        repo_path: Path to the git repository
+        timeout: Timeout in seconds
+
+    Returns:
+        CompletedProcess with the headers and at most one entry as stdout
+
+    Raises:
+        subprocess.TimeoutExpired: If git does not finish in time
+    """
+    argv, cwd = _spawn_args(repo_path, _STATUS_ARGS)
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        cwd=cwd,
+        env={**os.environ, **_QUERY_ENV},
+        close_fds=False,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout = proc.stdout
+    assert stdout is not None
+
+    async def read_until_entry() -> list[bytes]:
+        lines: list[bytes] = []
+        async for line in stdout:
+            lines.append(line)
+            if not line.startswith(b"#"):
+                break
+        return lines
+
+    try:
+        lines = await asyncio.wait_for(read_until_entry(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(_STATUS_ARGS, timeout) from None
+
+    stopped_early = bool(lines) and not lines[-1].startswith(b"#")
+    if stopped_early and proc.returncode is None:
+        proc.kill()
+    returncode = await proc.wait()
+
+    return subprocess.CompletedProcess(
+        args=_STATUS_ARGS,
+        returncode=0 if stopped_early else returncode,
+        stdout=b"".join(lines),
+        stderr=b"",
+    )
+
+
+def _run_coroutine(coro: Awaitable[_T]) -> _T:
+    """Run a coroutine to completion from synchronous code.
+
+    Works whether or not the calling thread already runs an event loop (the
+    TUI calls the scanner from Textual's loop thread).
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+
+    async def main() -> _T:
+        return await coro
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(main())
+
+    # asyncio.run() refuses to nest inside a running loop, so use a private
+    # loop on a helper thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, main()).result()
+
+
+def _load_pygit2() -> Optional[Any]:
+    """Import the optional pygit2 (libgit2) bindings.
+
+    Returns:
+        The pygit2 module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module("pygit2")
+    except ImportError:
+        return None
+
+
+# Slotted dataclasses need Python 3.10; older versions keep a per-instance dict
+_DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class RepoInfo:
     """Information about a git repository."""
 
@@ -69,6 +426,12 @@ class RepoInfo:
     remote_commit_message: str = ""
     error: Optional[str] = None
     fetch_status: Optional[str] = None  # "success", "failed", or None if not fetched yet
+    # Display order: owner then name, ignoring case
+    sort_key: tuple[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compute the sort key once, rather than on every sort."""
+        self.sort_key = (self.remote_owner.lower(), self.name.lower())
 
 
 class GitScanner:
@@ -79,6 +442,7 @@ class GitScanner:
         watch_directories: list[Path],
         max_depth: int = 3,
         runner: Optional[GitCommandRunner] = None,
+        async_runner: Optional[AsyncGitCommandRunner] = None,
     ):
         """Initialize scanner with directories to watch.
 
@@ -86,10 +450,24 @@ class GitScanner:
             watch_directories: List of directories to scan for git repos
             max_depth: Maximum directory depth to search (default: 3)
             runner: Git command runner (defaults to SubprocessGitRunner)
+            async_runner: Runner used by scan_all (defaults to AsyncGitRunner, or to
+                running `runner` on worker threads when a custom runner is given)
+
+        When neither runner is given and pygit2 is installed, repository info is
+        read in-process through libgit2 instead of by running git.
         """
         self.watch_directories = watch_directories
         self.max_depth = max_depth
         self.runner = runner if runner is not None else SubprocessGitRunner()
+        if async_runner is not None:
+            self.async_runner = async_runner
+        elif runner is None:
+            self.async_runner = AsyncGitRunner()
+        else:
+            self.async_runner = _ThreadedGitRunner(runner)
+        self._pygit2 = _load_pygit2() if runner is None and async_runner is None else None
+        self._default_runners = runner is None and async_runner is None
+        self._walk_cache = _read_walk_cache()
 
     def find_repositories(self) -> list[Path]:
         """Find all git repositories in watch directories.
@@ -100,46 +478,143 @@ class GitScanner:
         Returns:
             List of paths to git repositories
         """
-        repos: list[Path] = []
-        for directory in self.watch_directories:
-            if not directory.exists():
-                continue
+        roots = [directory for directory in self.watch_directories if directory.exists()]
+        results: list[tuple[list[Path], bool]]
+        if len(roots) <= 1:
+            results = [self._search_root(directory) for directory in roots]
+        else:
+            # The walk is dominated by syscalls that release the GIL, so
+            # separate roots can be searched in parallel
+            with ThreadPoolExecutor(max_workers=min(32, len(roots))) as executor:
+                results = list(executor.map(self._search_root, roots))
+
+        repos = [repo for found, _ in results for repo in found]
+        if any(walked for _, walked in results):
+            _write_walk_cache({str(root): self._walk_cache[str(root)] for root in roots})
+
+        # Decorate with the case-folded name so that repositories with the same
+        # name are ordered by their full path
+        return [repo for _, repo in sorted((repo.name.casefold(), repo) for repo in repos)]
+
+    def _search_root(self, directory: Path) -> tuple[list[Path], bool]:
+        """Search one watch directory for git repositories.
+
+        The result of the previous walk is reused while none of the directories
+        it visited have changed and every repository it found still has its
+        .git entry, which costs one stat per directory and repository instead
+        of listing them all.
 
-            # Search recursively with early stopping at git repos
-            self._search_directory(directory, repos, current_depth=0)
+        Args:
+            directory: Watch directory to search
 
-        return sorted(repos, key=lambda p: p.name.lower())
+        Returns:
+            Tuple of (repository paths found under the directory, whether the
+            directory had to be walked)
+        """
+        key = str(directory)
+        cached = self._walk_cache.get(key)
+        if (
+            cached is not None
+            and cached["max_depth"] == self.max_depth
+            and _dirs_unchanged(cached["dirs"])
+            # Removing a repository's .git leaves its parent's ctime alone
+            and all(_has_git_entry(repo) for repo in cached["repos"])
+        ):
+            return [Path(repo) for repo in cached["repos"]], False
 
-    def _search_directory(self, directory: Path, repos: list[Path], current_depth: int) -> None:
-        """Recursively search for git repositories with early stopping.
+        repos: list[Path] = []
+        dirs: dict[str, int] = {}
+        self._search_directory(directory, repos, dirs)
+        self._walk_cache[key] = {
+            "max_depth": self.max_depth,
+            "dirs": dirs,
+            "repos": [str(repo) for repo in repos],
+        }
+        return repos, True
+
+    def _search_directory(self, root: Path, repos: list[Path], dirs: dict[str, int]) -> None:
+        """Search a directory tree breadth-first for git repositories with early stopping.
 
         Args:
-            directory: Directory to search
+            root: Directory to search
             repos: List to append found repositories to
-            current_depth: Current search depth
+            dirs: Mapping to record the st_ctime_ns of visited non-repository
+                directories in
         """
-        # Check if this directory is a git repo
-        if (directory / ".git").exists():
-            repos.append(directory)
-            # Don't descend into git repositories
+        # Check if the root itself is a git repo
+        root_path = os.fspath(root)
+        if _has_git_entry(root_path):
+            repos.append(root)
             return
 
-        # Stop if we've reached max depth
-        if current_depth >= self.max_depth:
+        # Adding or removing an entry (such as .git) changes the ctime, as
+        # does a permission change that makes the directory readable
+        try:
+            dirs[root_path] = os.stat(root_path).st_ctime_ns
+        except OSError:
             return
 
-        # Search subdirectories
-        try:
-            for item in directory.iterdir():
-                # Skip hidden directories (except .git which we already checked)
-                if item.name.startswith("."):
-                    continue
+        pending: deque[tuple[str, int]] = deque()
+        if self.max_depth > 0:
+            pending.append((root_path, 0))
 
-                if item.is_dir():
-                    self._search_directory(item, repos, current_depth + 1)
-        except PermissionError as e:
-            # Skip directories we can't access
-            logger.debug(f"Permission denied accessing directory {directory}: {e}")
+        while pending:
+            directory, depth = pending.popleft()
+            try:
+                self._search_children(directory, depth + 1, repos, dirs, pending)
+            except PermissionError as e:
+                # Skip directories we can't access
+                logger.debug(f"Permission denied accessing directory {directory}: {e}")
+
+    def _search_children(
+        self,
+        directory: str,
+        depth: int,
+        repos: list[Path],
+        dirs: dict[str, int],
+        pending: deque[tuple[str, int]],
+    ) -> None:
+        """List one directory and classify its subdirectories.
+
+        Where supported, the directory is opened once and its children are
+        probed relative to that descriptor, so the kernel does not resolve the
+        full path again for every probe.
+
+        Args:
+            directory: Directory to list
+            depth: Search depth of the directory's children
+            repos: List to append found repositories to
+            dirs: Mapping to record the st_ctime_ns of non-repository children in
+            pending: Queue to append children that should be listed in turn
+
+        Raises:
+            PermissionError: If the directory cannot be listed
+        """
+        fd = os.open(directory, _DIR_OPEN_FLAGS) if _SCANDIR_FD else None
+        try:
+            # scandir entries carry the file type from the directory listing,
+            # so is_dir() needs no extra stat except for symlinks
+            with os.scandir(directory if fd is None else fd) as entries:
+                for entry in entries:
+                    # Skip hidden directories (.git itself is probed for below)
+                    if entry.name.startswith(".") or not entry.is_dir():
+                        continue
+
+                    path = os.path.join(directory, entry.name)
+                    if _has_git_entry(entry.name if fd is not None else path, fd):
+                        repos.append(Path(path))
+                        # Don't descend into git repositories
+                        continue
+
+                    try:
+                        dirs[path] = entry.stat().st_ctime_ns
+                    except OSError:
+                        continue
+                    if depth < self.max_depth:
+                        pending.append((path, depth))
+        finally:
+            if fd is not None:
+                os.close(fd)
 
     def get_repo_info(self, repo_path: Path) -> RepoInfo:
         """Get detailed information about a git repository.
@@ -150,31 +625,171 @@ class GitScanner:
         Returns:
             RepoInfo object with repository details
         """
+        if self._pygit2 is not None:
+            return self._get_repo_info_pygit2(repo_path)
+
+        outcomes: list[_CommandOutcome] = []
+        origin_url = _read_origin_url(repo_path)
+        for args in _REPO_INFO_COMMANDS:
+            try:
+                if args is _REMOTE_URL_ARGS and origin_url is not None:
+                    outcomes.append(_completed(args, origin_url))
+                else:
+                    outcomes.append(self.runner.run(repo_path, args, timeout=5, env=_QUERY_ENV))
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError, OSError) as e:
+                outcomes.append(e)
+        return self._build_repo_info(repo_path, outcomes)
+
+    async def get_repo_info_async(
+        self, repo_path: Path, semaphore: Optional[asyncio.Semaphore] = None
+    ) -> RepoInfo:
+        """Get detailed information about a git repository, running git concurrently.
+
+        Args:
+            repo_path: Path to the git repository
+            semaphore: Optional semaphore bounding the number of concurrent git processes
+
+        Returns:
+            RepoInfo object with repository details
+        """
+        if self._pygit2 is not None:
+            if semaphore is None:
+                return await _in_git_thread(self._get_repo_info_pygit2, repo_path)
+            async with semaphore:
+                return await _in_git_thread(self._get_repo_info_pygit2, repo_path)
+
+        origin_url = _read_origin_url(repo_path)
+
+        async def run(args: list[str]) -> subprocess.CompletedProcess[bytes]:
+            if args is _REMOTE_URL_ARGS and origin_url is not None:
+                return _completed(args, origin_url)
+            if semaphore is None:
+                return await query(args)
+            async with semaphore:
+                return await query(args)
+
+        def query(args: list[str]) -> Awaitable[subprocess.CompletedProcess[bytes]]:
+            if args is _STATUS_ARGS and self._default_runners:
+                return _stream_status(repo_path, timeout=5)
+            return self.async_runner.run(repo_path, args, timeout=5, env=_QUERY_ENV)
+
+        outcomes = await asyncio.gather(
+            *(run(args) for args in _REPO_INFO_COMMANDS), return_exceptions=True
+        )
+        return self._build_repo_info(repo_path, list(outcomes))
+
+    def _get_repo_info_pygit2(self, repo_path: Path) -> RepoInfo:
+        """Get repository information through libgit2, without spawning git.
+
+        Args:
+            repo_path: Path to the git repository
+
+        Returns:
+            RepoInfo object with repository details, or an error RepoInfo if the
+            repository cannot be read
+        """
+        pygit2: Any = self._pygit2
         try:
-            # Get current branch
-            branch_result = self.runner.run(
-                repo_path, ["git", "branch", "--show-current"], timeout=5
-            )
-            current_branch = branch_result.stdout.strip() or "detached HEAD"
+            repo = pygit2.Repository(str(repo_path))
+
+            # Get current branch and ahead/behind count against its upstream
+            ahead = behind = 0
+            if repo.head_is_unborn:
+                current_branch = repo.references["HEAD"].target.removeprefix("refs/heads/")
+            elif repo.head_is_detached:
+                current_branch = "detached HEAD"
+            else:
+                current_branch = repo.head.shorthand
+                upstream = repo.branches.local[current_branch].upstream
+                if upstream is not None:
+                    ahead, behind = repo.ahead_behind(repo.head.target, upstream.target)
+
+            # Check for working tree changes, ignoring ignored files like git does
+            status = "changes" if repo.status(untracked_files="normal") else "clean"
 
             # Get remote URL and extract owner and repo name
-            remote_result = self.runner.run(
-                repo_path, ["git", "remote", "get-url", "origin"], timeout=5
-            )
-            remote_url = remote_result.stdout.strip()
+            try:
+                remote_url = repo.remotes["origin"].url or ""
+            except KeyError:
+                remote_url = ""
             remote_owner = self._extract_owner(remote_url)
             name = self._extract_repo_name(remote_url) or repo_path.name
 
-            # Check for changes
-            status_result = self.runner.run(repo_path, ["git", "status", "--porcelain"], timeout=5)
-            has_changes = bool(status_result.stdout.strip())
+            # Get remote commit message
+            try:
+                commit = repo.revparse_single("origin/HEAD").peel(pygit2.Commit)
+                remote_commit_msg = _commit_subject(commit.raw_message).decode(errors="replace")
+            except (KeyError, ValueError, pygit2.GitError):
+                remote_commit_msg = ""
+
+            return RepoInfo(
+                name=name,
+                path=repo_path,
+                remote_owner=remote_owner,
+                current_branch=current_branch,
+                status=status,
+                ahead=ahead,
+                behind=behind,
+                remote_commit_message=remote_commit_msg,
+            )
+
+        except (pygit2.GitError, KeyError, ValueError) as e:
+            logger.error(f"libgit2 failed to read {repo_path}: {e}")
+            return RepoInfo(
+                name=repo_path.name,
+                path=repo_path,
+                remote_owner="N/A",
+                current_branch="N/A",
+                status="error",
+                error=f"Git command failed: {e}",
+            )
+        except OSError as e:
+            logger.error(f"File system error accessing {repo_path}: {e}")
+            return RepoInfo(
+                name=repo_path.name,
+                path=repo_path,
+                remote_owner="N/A",
+                current_branch="N/A",
+                status="error",
+                error=str(e),
+            )
+
+    def _build_repo_info(self, repo_path: Path, outcomes: list[_CommandOutcome]) -> RepoInfo:
+        """Build a RepoInfo from the outcomes of the _REPO_INFO_COMMANDS.
+
+        Args:
+            repo_path: Path to the git repository
+            outcomes: Result or raised exception for each command, in order
+
+        Returns:
+            RepoInfo object with repository details, or an error RepoInfo if a
+            required command failed
+        """
+        status_outcome, remote_outcome, log_outcome = outcomes
+        try:
+            # Get current branch, ahead/behind count and whether there are changes
+            # git runs with -C rather than in the repository, so a repository
+            # removed since the walk makes git exit nonzero instead of failing
+            # to start
+            status_result = _required(status_outcome)
+            if status_result.returncode != 0:
+                raise subprocess.CalledProcessError(
+                    status_result.returncode,
+                    status_result.args,
+                    status_result.stdout,
+                    status_result.stderr,
+                )
+            current_branch, ahead, behind, has_changes = self._parse_status_v2(status_result)
             status = "changes" if has_changes else "clean"
 
-            # Get ahead/behind count
-            ahead, behind = self._get_tracking_status(repo_path)
+            # Get remote URL and extract owner and repo name
+            remote_result = _required(remote_outcome)
+            remote_url = remote_result.stdout.strip().decode(errors="replace")
+            remote_owner = self._extract_owner(remote_url)
+            name = self._extract_repo_name(remote_url) or repo_path.name
 
             # Get remote commit message
-            remote_commit_msg = self._get_remote_commit_message(repo_path)
+            remote_commit_msg = self._parse_remote_commit_message(_optional(log_outcome))
 
             return RepoInfo(
                 name=name,
@@ -227,25 +842,7 @@ class GitScanner:
         Returns:
             Owner/organization name or 'N/A'
         """
-        if not remote_url:
-            return "N/A"
-
-        # Handle SSH URLs: git@github.com:owner/repo.git
-        if remote_url.startswith("git@"):
-            parts = remote_url.split(":")
-            if len(parts) > 1:
-                path_parts = parts[1].split("/")
-                if path_parts:
-                    return path_parts[0]
-
-        # Handle HTTPS URLs: https://github.com/owner/repo.git
-        if remote_url.startswith("http"):
-            parts = remote_url.rstrip("/").split("/")
-            if len(parts) >= 2:
-                return parts[-2]
-
-        # Handle local paths or other formats
-        return remote_url.split("/")[0] if "/" in remote_url else "local"
+        return _parse_remote(remote_url)[0]
 
     def _extract_repo_name(self, remote_url: str) -> str:
         """Extract repository name from git remote URL.
@@ -256,78 +853,90 @@ class GitScanner:
         Returns:
             Repository name or empty string if unavailable
         """
-        if not remote_url:
-            return ""
-
-        # Handle SSH URLs: git@github.com:owner/repo.git
-        if remote_url.startswith("git@"):
-            parts = remote_url.split(":")
-            if len(parts) > 1:
-                path_parts = parts[1].split("/")
-                if len(path_parts) >= 2:
-                    # Remove .git extension if present
-                    repo_name = path_parts[-1]
-                    return repo_name.removesuffix(".git")
-
-        # Handle HTTPS URLs: https://github.com/owner/repo.git
-        if remote_url.startswith("http"):
-            parts = remote_url.rstrip("/").split("/")
-            if len(parts) >= 1:
-                # Remove .git extension if present
-                repo_name = parts[-1]
-                return repo_name.removesuffix(".git")
+        return _parse_remote(remote_url)[1]
 
-        return ""
-
-    def _get_remote_commit_message(self, repo_path: Path) -> str:
-        """Get the most recent remote commit message.
+    def _parse_remote_commit_message(
+        self, result: Optional[subprocess.CompletedProcess[bytes]]
+    ) -> str:
+        """Parse the most recent remote commit message from `git log` output.
 
         Args:
-            repo_path: Path to the git repository
+            result: Result of the remote commit command, or None if it failed
 
         Returns:
             Remote commit message or empty string if unavailable
         """
-        try:
-            result = self.runner.run(
-                repo_path, ["git", "log", "origin/HEAD", "-1", "--pretty=format:%s"], timeout=5
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
+        if result is not None and result.returncode == 0:
+            return result.stdout.strip().decode(errors="replace")
+        return ""
 
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
-            pass
+    def _parse_status_v2(
+        self, result: subprocess.CompletedProcess[bytes]
+    ) -> tuple[str, int, int, bool]:
+        """Parse `git status --porcelain=v2 --branch` output.
 
-        return ""
+        Args:
+            result: Result of the status command
 
-    def _get_tracking_status(self, repo_path: Path) -> tuple[int, int]:
-        """Get ahead/behind count for current branch.
+        Returns:
+            Tuple of (current_branch, ahead_count, behind_count, has_changes)
+        """
+        current_branch = ""
+        ahead = behind = 0
+        has_changes = False
+
+        # Only the branch name is decoded; int() parses the counts from bytes
+        for line in result.stdout.splitlines():
+            if line.startswith(b"# branch.head "):
+                head = line[len(b"# branch.head ") :]
+                current_branch = "" if head == b"(detached)" else head.decode(errors="replace")
+            elif line.startswith(b"# branch.ab "):
+                # Format: "# branch.ab +<ahead> -<behind>"
+                parts = line.split()
+                if len(parts) == 4:
+                    with contextlib.suppress(ValueError):
+                        ahead, behind = int(parts[2]), -int(parts[3])
+            elif line and not line.startswith(b"#"):
+                # Any entry line is a changed, unmerged or untracked path. All
+                # header lines precede the entries, so nothing is left to read.
+                has_changes = True
+                break
+
+        return current_branch or "detached HEAD", ahead, behind, has_changes
+
+    def last_fetch_time(self, repo_path: Path) -> Optional[float]:
+        """Get when a repository was last fetched, by anyone.
 
         Args:
             repo_path: Path to the git repository
 
         Returns:
-            Tuple of (ahead_count, behind_count)
+            Modification time of .git/FETCH_HEAD, or None if it has never been
+            fetched or .git is not a directory
         """
         try:
-            result = self.runner.run(
-                repo_path,
-                ["git", "rev-list", "--left-right", "--count", "HEAD...@{upstream}"],
-                timeout=5,
-            )
+            return os.stat(os.path.join(repo_path, ".git", "FETCH_HEAD")).st_mtime
+        except OSError:
+            return None
 
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split()
-                if len(parts) == 2:
-                    ahead = int(parts[0])
-                    behind = int(parts[1])
-                    return ahead, behind
+    def fetch_head(self, repo_path: Path) -> Optional[bytes]:
+        """Read the refs recorded by a repository's last fetch.
 
-        except (subprocess.TimeoutExpired, ValueError, subprocess.CalledProcessError):
-            pass
+        Comparing this before and after a fetch tells whether the fetch moved
+        any remote branch.
 
-        return 0, 0
+        Args:
+            repo_path: Path to the git repository
+
+        Returns:
+            Contents of .git/FETCH_HEAD, or None if it has never been fetched
+            or .git is not a directory
+        """
+        try:
+            with open(os.path.join(repo_path, ".git", "FETCH_HEAD"), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
 
     def fetch_repo(self, repo_path: Path) -> tuple[bool, str]:
         """Fetch updates for a single repository.
@@ -340,13 +949,15 @@ class GitScanner:
         """
         try:
             logger.debug(f"Fetching repository: {repo_path}")
-            result = self.runner.run(repo_path, ["git", "fetch", "--all"], timeout=30)
+            result = self.runner.run(repo_path, _FETCH_ARGS, timeout=30, env=_FETCH_ENV)
 
             if result.returncode == 0:
                 logger.debug(f"Successfully fetched {repo_path}")
                 return True, "Success"
 
-            error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
+            error_msg = (result.stderr.strip() or result.stdout.strip()).decode(
+                errors="replace"
+            ) or "Unknown error"
             logger.warning(f"Failed to fetch {repo_path}: {error_msg}")
             return False, error_msg
 
@@ -360,17 +971,37 @@ class GitScanner:
             logger.error(f"Git fetch command failed for {repo_path}: {e}")
             return False, str(e)
 
-    def fetch_all(self) -> dict[Path, tuple[bool, str]]:
-        """Fetch updates for all repositories.
+    def fetch_all(self, parallelism: int = MAX_PARALLEL_GIT) -> dict[Path, tuple[bool, str]]:
+        """Fetch updates for all repositories concurrently.
+
+        Args:
+            parallelism: Maximum number of repositories fetched at once
+
+        Returns:
+            Dictionary mapping repo paths to (success, message) tuples
+        """
+        return _run_coroutine(self.fetch_all_async(parallelism))
+
+    async def fetch_all_async(
+        self, parallelism: int = MAX_PARALLEL_GIT
+    ) -> dict[Path, tuple[bool, str]]:
+        """Fetch updates for all repositories concurrently.
+
+        Args:
+            parallelism: Maximum number of repositories fetched at once
 
         Returns:
             Dictionary mapping repo paths to (success, message) tuples
         """
         repos = self.find_repositories()
-        results = {}
-        for repo in repos:
-            results[repo] = self.fetch_repo(repo)
-        return results
+        semaphore = asyncio.Semaphore(parallelism)
+
+        async def fetch(repo: Path) -> tuple[bool, str]:
+            async with semaphore:
+                return await _in_git_thread(self.fetch_repo, repo)
+
+        results = await asyncio.gather(*(fetch(repo) for repo in repos))
+        return dict(zip(repos, results))
 
     def scan_all(self) -> list[RepoInfo]:
         """Scan all repositories and return their information.
@@ -378,5 +1009,298 @@ class GitScanner:
         Returns:
             List of RepoInfo objects
         """
+        return _run_coroutine(self.scan_all_async())
+
+    async def scan_all_async(self) -> list[RepoInfo]:
+        """Scan all repositories concurrently and return their information.
+
+        Returns:
+            List of RepoInfo objects, in the same order as find_repositories()
+        """
         repos = self.find_repositories()
-        return [self.get_repo_info(repo) for repo in repos]
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_GIT)
+        return list(
+            await asyncio.gather(*(self.get_repo_info_async(repo, semaphore) for repo in repos))
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_remote(remote_url: str) -> tuple[str, str]:
+    """Split a git remote URL into owner and repository name.
+
+    Args:
+        remote_url: Git remote URL
+
+    Returns:
+        Tuple of (owner, repo_name); the owner is 'N/A' if the URL has none and the
+        repository name is empty if it cannot be determined
+    """
+    if not remote_url:
+        return "N/A", ""
+
+    match = _REMOTE_RE.match(remote_url)
+    if match is None:
+        # Handle local paths or other formats
+        return (remote_url.split("/")[0] if "/" in remote_url else "local"), ""
+    return match["owner"] or match["scp_owner"] or "N/A", match["repo"]
+
+
+def _commit_subject(message: bytes) -> bytes:
+    """Get the subject of a commit message, as `git log --pretty=format:%s` does.
+
+    Args:
+        message: Raw commit message
+
+    Returns:
+        First paragraph of the message with its lines joined by spaces
+    """
+    paragraph = message.strip().split(b"\n\n", 1)[0]
+    return b" ".join(line.strip() for line in paragraph.splitlines())
+
+
+def _has_git_entry(path: str, dir_fd: Optional[int] = None) -> bool:
+    """Check whether a directory contains a .git entry.
+
+    The entry may be a directory or, for worktrees and submodules, a file.
+
+    Args:
+        path: Directory to check, relative to dir_fd if one is given
+        dir_fd: Descriptor of the directory path is relative to
+
+    Returns:
+        True if path/.git exists
+    """
+    try:
+        os.stat(os.path.join(path, ".git"), dir_fd=dir_fd, follow_symlinks=False)
+    except OSError:
+        return False
+    return True
+
+
+def _read_origin_url(repo_path: Path) -> Optional[bytes]:
+    """Read the URL of the origin remote straight from .git/config.
+
+    Handles the plain configs git itself writes. Anything that would need git's
+    full config semantics to answer (includes, URL rewriting, quoting or
+    escapes, worktrees whose .git is a file) is left to `git remote get-url`,
+    as are all repositories while the global or system config rewrites URLs.
+
+    Args:
+        repo_path: Path to the git repository
+
+    Returns:
+        The URL (empty if there is no origin remote), or None if git should be
+        asked instead
+    """
+    if _global_url_rewrites():
+        return None
+
+    try:
+        with open(os.path.join(repo_path, ".git", "config"), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    section = b""
+    url: Optional[bytes] = None
+    for raw_line in data.splitlines():
+        line = raw_line.strip()
+        if not line or line[:1] in (b"#", b";"):
+            continue
+
+        if line.startswith(b"["):
+            header, _, rest = line[1:].partition(b"]")
+            name, _, subsection = header.partition(b" ")
+            name = name.lower()
+            if rest.strip() or name in (b"include", b"includeif"):
+                return None
+            section = name + b" " + subsection.strip()
+            continue
+
+        key, _, value = line.partition(b"=")
+        key = key.strip().lower()
+        if key in (b"insteadof", b"pushinsteadof"):
+            return None
+        if section == b'remote "origin"' and key == b"url" and url is None:
+            url = value.strip()
+            if any(c in url for c in (b'"', b"\\", b"#", b";")):
+                return None
+
+    return url if url is not None else b""
+
+
+def _global_config_files() -> list[str]:
+    """List the global and system git config files, as git looks them up.
+
+    Returns:
+        Paths of the config files git reads besides the repository's own
+    """
+    global_file = os.environ.get("GIT_CONFIG_GLOBAL")
+    if global_file is not None:
+        files = [global_file] if global_file else []
+    else:
+        config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+        files = [os.path.join(config_home, "git", "config"), os.path.expanduser("~/.gitconfig")]
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        files.append(os.environ.get("GIT_CONFIG_SYSTEM") or "/etc/gitconfig")
+    return files
+
+
+def _global_url_rewrites() -> bool:
+    """Check whether git's global or system config may rewrite remote URLs.
+
+    Costs one stat per config file; the files are only read again when they
+    change.
+
+    Returns:
+        True if url.*.insteadOf rules (or includes that may add them) apply to
+        every repository, or if that cannot be ruled out
+    """
+    if "GIT_CONFIG_PARAMETERS" in os.environ or "GIT_CONFIG_COUNT" in os.environ:
+        return True
+
+    stamps = []
+    for path in _global_config_files():
+        try:
+            stamps.append((path, os.stat(path).st_mtime_ns))
+        except FileNotFoundError:
+            continue
+        except OSError:
+            return True
+    return _files_rewrite_urls(tuple(stamps))
+
+
+@functools.lru_cache(maxsize=8)
+def _files_rewrite_urls(stamps: tuple[tuple[str, int], ...]) -> bool:
+    """Check whether any of the given git config files may rewrite remote URLs.
+
+    Args:
+        stamps: (path, st_mtime_ns) of each file; the mtime only keys the cache
+
+    Returns:
+        True if a file sets insteadOf or pushInsteadOf, includes other files,
+        or cannot be read
+    """
+    for path, _mtime in stamps:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return True
+
+        for raw_line in data.splitlines():
+            line = raw_line.strip()
+            if line.startswith(b"["):
+                header, _, rest = line[1:].partition(b"]")
+                name = header.partition(b" ")[0].partition(b".")[0].lower()
+                if rest.strip() or name in (b"include", b"includeif"):
+                    return True
+            elif line.partition(b"=")[0].strip().lower() in (b"insteadof", b"pushinsteadof"):
+                return True
+    return False
+
+
+def _completed(args: list[str], stdout: bytes) -> subprocess.CompletedProcess[bytes]:
+    """Build a successful result for a command answered without running git.
+
+    Args:
+        args: The command that would have been run
+        stdout: Output the command would have printed
+
+    Returns:
+        CompletedProcess with return code 0
+    """
+    return subprocess.CompletedProcess(args=args, returncode=0, stdout=stdout, stderr=b"")
+
+
+def _walk_cache_file() -> Path:
+    """Get the location of the repository list cache.
+
+    Returns:
+        Path to the cache file
+    """
+    return _cache_dir() / "repos.json"
+
+
+def _read_walk_cache() -> dict[str, _WalkCacheEntry]:
+    """Read the repository lists found by earlier walks.
+
+    Returns:
+        Mapping of watch directory to its cached walk, empty on any failure
+    """
+    try:
+        with open(_walk_cache_file(), "rb") as f:
+            data = _loads(f.read())
+        if data["version"] != _WALK_CACHE_VERSION:
+            return {}
+        roots: dict[str, _WalkCacheEntry] = data["roots"]
+        return roots
+    except Exception:
+        # Missing, unreadable or stale-format cache files are all just misses
+        return {}
+
+
+def _write_walk_cache(roots: dict[str, _WalkCacheEntry]) -> None:
+    """Store the repository lists found by walking the watch directories.
+
+    The cache is an optimization only, so failures are logged and ignored.
+
+    Args:
+        roots: Mapping of watch directory to its walk result
+    """
+    cache_file = _walk_cache_file()
+    try:
+        _atomic_write(
+            cache_file, _dumps({"version": _WALK_CACHE_VERSION, "roots": roots}), durable=False
+        )
+    except OSError as e:
+        logger.debug(f"Could not write repository cache {cache_file}: {e}")
+
+
+def _dirs_unchanged(dirs: dict[str, int]) -> bool:
+    """Check whether directories still have the ctimes recorded by a walk.
+
+    Args:
+        dirs: Mapping of directory path to st_ctime_ns
+
+    Returns:
+        True if every directory exists with the recorded ctime
+    """
+    try:
+        return all(os.stat(path).st_ctime_ns == ctime for path, ctime in dirs.items())
+    except OSError:
+        return False
+
+
+def _required(outcome: _CommandOutcome) -> subprocess.CompletedProcess[bytes]:
+    """Get the result of a command whose failure makes the repo an error.
+
+    Args:
+        outcome: Command result or the exception it raised
+
+    Returns:
+        The command result
+
+    Raises:
+        BaseException: The exception the command raised, if any
+    """
+    if isinstance(outcome, BaseException):
+        raise outcome
+    return outcome
+
+
+def _optional(outcome: _CommandOutcome) -> Optional[subprocess.CompletedProcess[bytes]]:
+    """Get the result of a command whose git failures are tolerated.
+
+    Args:
+        outcome: Command result or the exception it raised
+
+    Returns:
+        The command result, or None if the command timed out or failed
+
+    Raises:
+        BaseException: Any other exception the command raised
+    """
+    if isinstance(outcome, (subprocess.TimeoutExpired, subprocess.CalledProcessError)):
+        return None
+    return _required(outcome)
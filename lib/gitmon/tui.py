@@ -1,26 +1,117 @@
 """Textual TUI interface for gitmon."""
 
+import functools
 import os
 import re
+import shutil
 import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.events import MouseMove
+from textual.events import AppBlur, AppFocus, MouseMove
 from textual.message import Message
 from textual.widgets import DataTable, Footer, Header, Static
-from textual.worker import Worker, WorkerState
+from textual.worker import Worker, get_current_worker
 
 from .config import Config
 from .scanner import GitScanner, RepoInfo
 
-try:
+if TYPE_CHECKING:
     from textual.timer import Timer
-except ImportError:
-    Timer = Any  # type: ignore
+
+# Table cells for one repository: name, branch, status and tracking
+_RowCells = tuple[Union[str, Text], ...]
+
+# Keys of the table's columns, in display order
+_COLUMN_KEYS = ("repo", "branch", "status", "tracking")
+
+# Cells shared by every row showing the same value. The table only reads
+# them, so one instance of each is built up front rather than one per row.
+_STATUS_TEXTS = {
+    "clean": Text("○ clean", style="green"),
+    "stashed": Text("◐ stashed", style="blue"),
+    "changes": Text("● changes", style="yellow"),
+    "error": Text("✗ error", style="red"),
+}
+_FETCH_OK = Text("✓", style="green")
+_FETCH_FAILED = Text("✗", style="red")
+
+
+@functools.lru_cache(maxsize=4096)
+def _repo_label(owner: str, name: str) -> Text:
+    """Get the table cell for a repository and its owner.
+
+    Args:
+        owner: Owner of the repository's remote
+        name: Name of the repository
+
+    Returns:
+        Repository displayed as "[owner] name"
+    """
+    # A Text cell is never parsed as markup, so the brackets need no escaping
+    return Text(f"[{owner}] {name}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _branch_text(branch: str) -> Text:
+    """Get the table cell for a branch name.
+
+    Args:
+        branch: Name of the branch
+
+    Returns:
+        Branch name styled for the branch column
+    """
+    return Text(branch, style="cyan")
+
+
+@functools.lru_cache(maxsize=256)
+def _tracking_text(fetch_status: Optional[str], ahead: int, behind: int) -> Union[str, Text]:
+    """Get the table cell for a repository's fetch status and branch divergence.
+
+    Only a handful of combinations occur across all repositories, so cells
+    are cached and shared between rows.
+
+    Args:
+        fetch_status: "success", "failed", or None to show no fetch mark
+        ahead: Commits ahead of upstream
+        behind: Commits behind upstream
+
+    Returns:
+        Fetch mark first, then divergence indicators, separated by two spaces;
+        an empty string if there is nothing to show
+    """
+    if not fetch_status and ahead <= 0 and behind <= 0:
+        return ""
+
+    tracking = Text()
+    if fetch_status:
+        mark = _FETCH_OK if fetch_status == "success" else _FETCH_FAILED
+        tracking.append_text(mark)
+    if ahead > 0:
+        tracking.append(f"  ↑ {ahead}" if tracking else f"↑ {ahead}")
+    if behind > 0:
+        tracking.append(f"  ↓ {behind}" if tracking else f"↓ {behind}")
+    return tracking
+
+
+def _worker_busy(worker: Optional[Worker[Any]]) -> bool:
+    """Check whether a worker has been started and not yet finished.
+
+    Args:
+        worker: Worker to check, or None if none was started
+
+    Returns:
+        True if the worker is pending or running
+    """
+    return worker is not None and not worker.is_finished
 
 
 def _simplify_fetch_error(error_msg: str) -> str:
@@ -78,22 +169,46 @@ class HoverableDataTable(DataTable[Any]):
             super().__init__()
             self.row_index = row_index
 
+    # Minimum seconds between hovered-row reports, so sweeping the mouse across
+    # the table posts a few messages rather than one per mouse event
+    HOVER_DELAY = 0.075
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize the table; arguments are passed on to DataTable."""
+        super().__init__(*args, **kwargs)
+        self._last_row = -2  # Row last reported; -2 means none reported yet
+        self._pending_row: Optional[int] = None
+        self._hover_timer: Optional[Timer] = None
+
     def on_mouse_move(self, event: MouseMove) -> None:
         """Handle mouse movement within the table."""
-        # Post a custom message to parent app with row information
-        try:
-            # Calculate row from mouse position
-            relative_y = event.y - 1  # Subtract header row
-            if relative_y >= 0:
-                self.post_message(self.RowHovered(row_index=relative_y))
-            else:
-                self.post_message(self.RowHovered(row_index=-1))
-        except (AttributeError, ValueError, TypeError):
-            # Handle edge cases with mouse event coordinates
-            self.post_message(self.RowHovered(row_index=-1))
+        # Calculate row from mouse position (subtract header row)
+        row = max(-1, event.y - 1)
+        self._pending_row = row
+        if row == self._last_row:
+            # Moving within the reported row; drop any report still pending
+            if self._hover_timer is not None:
+                self._hover_timer.stop()
+                self._hover_timer = None
+            return
+
+        if self._hover_timer is None:
+            self._hover_timer = self.set_timer(self.HOVER_DELAY, self._flush_hover)
+
+    def _flush_hover(self) -> None:
+        """Report the row the mouse is over once it has settled."""
+        self._hover_timer = None
+        if self._pending_row is not None and self._pending_row != self._last_row:
+            self._last_row = self._pending_row
+            self.post_message(self.RowHovered(row_index=self._pending_row))
 
     def on_leave(self, _event: Any) -> None:
         """Handle mouse leaving the table."""
+        if self._hover_timer is not None:
+            self._hover_timer.stop()
+            self._hover_timer = None
+        self._pending_row = None
+        self._last_row = -1
         self.post_message(self.RowHovered(row_index=-1))
 
 
@@ -103,13 +218,21 @@ class GitMonApp(App[None]):
     CSS_PATH = Path(__file__).parent / "gitmon.tcss"
 
     BINDINGS = [
-        Binding("r", "refresh", "Refresh", priority=True),
+        # Pressing r always rescans; only timer and focus refreshes coalesce
+        Binding("r", "refresh(True)", "Refresh", priority=True),
         Binding("f", "fetch", "Fetch All", priority=True),
         Binding("a", "toggle_auto_fetch", "Auto-Fetch", priority=True),
         Binding("q", "quit", "Quit", priority=True),
         Binding("c", "open_config", "Config", priority=True),
     ]
 
+    # Minimum seconds between fetch progress updates
+    FETCH_PROGRESS_INTERVAL = 0.1
+
+    # Timer and focus refreshes within this many seconds of the last scan
+    # reuse its result
+    REFRESH_COALESCE_WINDOW = 0.5
+
     def __init__(self, config: Config):
         """Initialize the application.
 
@@ -120,17 +243,37 @@ class GitMonApp(App[None]):
         self.config = config
         self.scanner = GitScanner(config.get_expanded_directories(), config.max_depth)
         self.repos: list[RepoInfo] = []
+        self._sorted_repos: list[RepoInfo] = []  # self.repos in display order
+        self._repo_by_path: dict[Path, RepoInfo] = {}  # self.repos keyed by path
         self._fetch_worker: Optional[Worker[dict[Path, tuple[bool, str]]]] = None
+        self._scan_worker: Optional[Worker[None]] = None
+        self._refresh_pending = False  # Refresh requested while a scan was running
+        self._last_scan_time = 0.0  # time.monotonic() when the last scan was shown
+        self._app_focused = True  # False while the terminal reports it is unfocused
+        self._timestamp = (0, "")  # Last formatted timestamp and its second
         self._auto_fetch_timer: Optional[Timer] = None
         self._fetch_results: dict[Path, tuple[bool, str]] = {}  # Track fetch status by repo path
+        # Cells currently shown in the table, keyed by row key in display order
+        self._row_cells: dict[str, _RowCells] = {}
+        # Hover text for each row in display order, built once per refresh
+        self._hover_texts: list[str] = []
+        self._hover_row = -1  # Row whose info is shown, -1 if none
+        self._hover_text: Optional[str] = None  # Text currently shown in the hover info
 
     def compose(self) -> ComposeResult:
         """Compose the application layout."""
+        # Keep handles on the widgets that are updated, so refreshes and hovers
+        # don't have to query the DOM for them
+        self._info_bar = Static(id="info-bar")
+        self._table = HoverableDataTable()
+        self._hover_info = Static(id="hover-info")
+        self._fetch_status = Static(id="fetch-status")
+
         yield Header()
-        yield Static(id="info-bar")
-        yield HoverableDataTable()
-        yield Static(id="hover-info")
-        yield Static(id="fetch-status")
+        yield self._info_bar
+        yield self._table
+        yield self._hover_info
+        yield self._fetch_status
         yield Footer()
 
     def on_mount(self) -> None:
@@ -138,160 +281,305 @@ class GitMonApp(App[None]):
         self.title = "GitMon - Git Repository Monitor"
 
         # Setup the data table
-        table = self.query_one(DataTable)
+        table = self._table
         table.cursor_type = "none"
         table.zebra_stripes = True
         table.can_focus = False  # Disable focus to prevent keyboard interaction
 
         # Add columns
-        table.add_column("Repository", width=50)
-        table.add_column("Branch", width=20)
-        table.add_column("Status", width=15)
-        table.add_column("Tracking", width=15)
+        table.add_column("Repository", width=50, key="repo")
+        table.add_column("Branch", width=20, key="branch")
+        table.add_column("Status", width=15, key="status")
+        table.add_column("Tracking", width=15, key="tracking")
 
         # Initial scan
         self.action_refresh()
 
         # Set up auto-refresh timer
-        self.set_interval(self.config.refresh_interval, self.action_refresh)
+        self.set_interval(self.config.refresh_interval, self._refresh_tick)
 
         # Set up auto-fetch timer and trigger initial fetch if enabled
         if self.config.auto_fetch_enabled:
             self._auto_fetch_timer = self.set_interval(
-                self.config.auto_fetch_interval, self.action_fetch
+                self.config.auto_fetch_interval, self._auto_fetch
             )
             # Trigger an immediate fetch on startup to populate status indicators
             self.action_fetch()
 
-    def _get_sorted_repos(self) -> list[RepoInfo]:
-        """Get repositories sorted by owner then name.
+    def on_app_blur(self, _event: AppBlur) -> None:
+        """Pause periodic refreshes while the terminal is in the background."""
+        self._app_focused = False
 
-        Returns:
-            List of RepoInfo sorted alphabetically by owner (case-insensitive), then by name.
+    def on_app_focus(self, _event: AppFocus) -> None:
+        """Resume periodic refreshes, catching up at once if the display is stale."""
+        self._app_focused = True
+        if time.monotonic() - self._last_scan_time > self.config.refresh_interval:
+            self.action_refresh()
+
+    def _refresh_tick(self) -> None:
+        """Refresh on the auto-refresh timer, unless nobody is looking.
+
+        Terminals that don't report focus changes never blur the app, so it is
+        refreshed as before.
         """
-        return sorted(self.repos, key=lambda r: (r.remote_owner.lower(), r.name.lower()))
+        if self._app_focused:
+            self.action_refresh()
 
-    def action_refresh(self) -> None:
-        """Refresh repository information."""
-        table = self.query_one(DataTable)
-        info_bar = self.query_one("#info-bar", Static)
+    def action_refresh(self, force: bool = False) -> None:
+        """Refresh repository information in background.
+
+        Args:
+            force: Scan even if the last scan finished moments ago; the
+                refresh key and finished fetches force, timer ticks and
+                regained focus don't
+        """
+        # Refreshes requested while a scan runs are coalesced into one more
+        # scan after it, rather than piling up scans on a slow machine
+        if _worker_busy(self._scan_worker):
+            self._refresh_pending = True
+            return
+
+        # A timer tick right after another refresh would only repeat its scan
+        if not force and time.monotonic() - self._last_scan_time < self.REFRESH_COALESCE_WINDOW:
+            return
 
         # Update info bar
-        info_bar.update(f"Scanning repositories... (Last refresh: {self._get_timestamp()})")
+        self._info_bar.update(f"Scanning repositories... (Last refresh: {self._get_timestamp()})")
+
+        # Scan on a worker thread so the UI keeps handling input meanwhile
+        self._scan_worker = self.run_worker(self._scan_repos, thread=True, group="scan")
 
-        # Scan repositories
-        self.repos = self.scanner.scan_all()
+    def _scan_repos(self) -> None:
+        """Background worker to scan and sort repositories for display."""
+        repos = self.scanner.scan_all()
+
+        # Sort repositories by owner then name, once per scan; hovering reads
+        # the sorted list many times between scans
+        sorted_repos = sorted(repos, key=attrgetter("sort_key"))
+
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._apply_scan, repos, sorted_repos)
+
+    def _apply_scan(self, repos: list[RepoInfo], sorted_repos: list[RepoInfo]) -> None:
+        """Display the result of a scan.
+
+        Args:
+            repos: Scanned repositories
+            sorted_repos: The same repositories in display order
+        """
+        self._last_scan_time = time.monotonic()
+        self.repos = repos
+        self._repo_by_path = {repo.path: repo for repo in repos}
+        self._sorted_repos = sorted_repos
+        self._show_repos()
+
+        # The pending refresh was requested during this scan, so it may need
+        # newer data than the scan saw
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._scan_worker = None
+            self.action_refresh(force=True)
+
+    def _show_repos(self) -> None:
+        """Display the scanned repositories with the latest fetch results."""
+        table = self._table
+        info_bar = self._info_bar
+        sorted_repos = self._sorted_repos
 
         # Apply fetch status from previous fetch results
-        for repo in self.repos:
-            if repo.path in self._fetch_results:
-                success, _ = self._fetch_results[repo.path]
+        for path, (success, _) in self._fetch_results.items():
+            repo = self._repo_by_path.get(path)
+            if repo is not None:
                 repo.fetch_status = "success" if success else "failed"
 
-        # Sort repositories by owner then name
-        sorted_repos = self._get_sorted_repos()
-
-        # Clear and repopulate table
-        table.clear()
-        for repo in sorted_repos:
-            # Format status with color
-            if repo.status == "clean":
-                status = Text("○ clean", style="green")
-            elif repo.status == "stashed":
-                status = Text("◐ stashed", style="blue")
-            elif repo.status == "changes":
-                status = Text("● changes", style="yellow")
-            else:
-                status = Text("✗ error", style="red")
-
-            # Format tracking info with fetch status first, then branch divergence
-            tracking_parts = []
-
-            # Add fetch status indicator first if auto-fetch is enabled
-            if self.config.auto_fetch_enabled and repo.fetch_status:
-                if repo.fetch_status == "success":
-                    tracking_parts.append(Text("✓", style="green"))
-                else:  # failed
-                    tracking_parts.append(Text("✗", style="red"))
-
-            # Add branch divergence indicators
-            if repo.ahead > 0 or repo.behind > 0:
-                if repo.ahead > 0:
-                    tracking_parts.append(Text(f"↑ {repo.ahead}"))
-                if repo.behind > 0:
-                    tracking_parts.append(Text(f"↓ {repo.behind}"))
-
-            # Combine all parts with spacing
-            tracking = Text("  ").join(tracking_parts) if tracking_parts else ""
-
-            # Format repository with owner
-            # Escape square brackets to prevent Rich markup interpretation
-            repo_display = f"\\[{repo.remote_owner}] {repo.name}"
-
-            # Add row
-            table.add_row(repo_display, Text(repo.current_branch, style="cyan"), status, tracking)
-
-        # Update info bar with stats
-        clean_count = sum(1 for r in self.repos if r.status == "clean")
-        stashed_count = sum(1 for r in self.repos if r.status == "stashed")
-        changes_count = sum(1 for r in self.repos if r.status == "changes")
-        error_count = sum(1 for r in self.repos if r.status == "error")
-
-        stats = f"Directories: {len(self.config.watch_directories)} | "
-        stats += f"Repositories: {len(self.repos)} | "
-        stats += f"Clean: {clean_count}"
+        # Update the table in place, touching only cells whose content changed
+        rows = {str(repo.path): self._render_row(repo) for repo in sorted_repos}
+        with self.batch_update():
+            self._update_table(table, rows)
+
+        # Build hover texts up front so hovering is a lookup, and bring the
+        # shown one up to date
+        self._hover_texts = [self._render_hover_text(repo) for repo in sorted_repos]
+        if self._hover_row >= 0:
+            self._show_repo_info(self._hover_row)
+
+        # Update info bar with stats, counting every status in one pass
+        counts = Counter(repo.status for repo in self.repos)
+        clean_count = counts["clean"]
+        stashed_count = counts["stashed"]
+        changes_count = counts["changes"]
+        error_count = counts["error"]
+
+        stats = [
+            f"Directories: {len(self.config.watch_directories)}",
+            f"Repositories: {len(self.repos)}",
+            f"Clean: {clean_count}",
+        ]
         if stashed_count > 0:
-            stats += f" | Stashed: {stashed_count}"
+            stats.append(f"Stashed: {stashed_count}")
         if changes_count > 0:
-            stats += f" | Changes: {changes_count}"
+            stats.append(f"Changes: {changes_count}")
         if error_count > 0:
-            stats += f" | Errors: {error_count}"
+            stats.append(f"Errors: {error_count}")
 
         # Add auto-fetch status
         if self.config.auto_fetch_enabled:
-            stats += f" | Auto-fetch: ON ({self.config.auto_fetch_interval}s)"
+            stats.append(f"Auto-fetch: ON ({self.config.auto_fetch_interval}s)")
+        else:
+            stats.append("Auto-fetch: OFF")
+
+        info_bar.update(" | ".join(stats))
+
+    def _render_row(self, repo: RepoInfo) -> _RowCells:
+        """Build the table cells for a repository.
+
+        Args:
+            repo: Repository to display
+
+        Returns:
+            Cells for the repository, branch, status and tracking columns
+        """
+        # Format status with color
+        status = _STATUS_TEXTS.get(repo.status, _STATUS_TEXTS["error"])
+
+        # Format tracking info; the fetch mark is only shown with auto-fetch on
+        fetch_status = repo.fetch_status if self.config.auto_fetch_enabled else None
+        tracking = _tracking_text(fetch_status, repo.ahead, repo.behind)
+
+        # Labels and branch cells are cached, so unchanged rows reuse them
+        label = _repo_label(repo.remote_owner, repo.name)
+        return label, _branch_text(repo.current_branch), status, tracking
+
+    def _update_table(self, table: DataTable[Any], rows: dict[str, _RowCells]) -> None:
+        """Bring the table in line with the given rows, reusing existing rows.
+
+        Rows for repositories that disappeared are removed, cells are updated
+        only where their content changed, and new rows are appended. The table
+        is only rebuilt when rows would otherwise end up out of order.
+
+        Args:
+            table: Table to update
+            rows: Cells for each row key, in display order
+        """
+        kept = [key for key in self._row_cells if key in rows]
+        order = list(rows)
+
+        if order[: len(kept)] != kept:
+            # Rows were reordered (e.g. a repo was inserted mid-list); rebuild
+            table.clear()
+            for key, cells in rows.items():
+                table.add_row(*cells, key=key)
         else:
-            stats += " | Auto-fetch: OFF"
+            for key in self._row_cells.keys() - rows.keys():
+                table.remove_row(key)
+            for key in kept:
+                old_cells, new_cells = self._row_cells[key], rows[key]
+                for column, old_cell, new_cell in zip(_COLUMN_KEYS, old_cells, new_cells):
+                    if old_cell != new_cell:
+                        table.update_cell(key, column, new_cell)
+            for key in order[len(kept) :]:
+                table.add_row(*rows[key], key=key)
+
+        self._row_cells = rows
+
+    def _auto_fetch(self) -> None:
+        """Fetch repositories on the auto-fetch timer.
+
+        Repositories fetched within the last half interval, e.g. by hand, are
+        left alone until the next tick. Ticks that land while a fetch is still
+        running are dropped.
+        """
+        if _worker_busy(self._fetch_worker):
+            return
+        self.action_fetch(min_age=self.config.auto_fetch_interval / 2)
 
-        info_bar.update(stats)
+    def action_fetch(self, min_age: float = 0) -> None:
+        """Fetch updates for all repositories in background.
 
-    def action_fetch(self) -> None:
-        """Fetch updates for all repositories in background."""
+        Args:
+            min_age: Skip repositories fetched less than this many seconds ago
+        """
         # Check if a fetch is already running
-        if self._fetch_worker and self._fetch_worker.state == WorkerState.RUNNING:
-            fetch_status = self.query_one("#fetch-status", Static)
+        if _worker_busy(self._fetch_worker):
+            fetch_status = self._fetch_status
             fetch_status.update("Fetch already in progress...")
             fetch_status.styles.display = "block"
             return
 
         # Clear and show fetch status widget, then start the background fetch worker
-        fetch_status = self.query_one("#fetch-status", Static)
+        fetch_status = self._fetch_status
         fetch_status.update("Starting fetch...")
         fetch_status.styles.display = "block"
-        self._fetch_worker = self.run_worker(self._fetch_all_repos, thread=True)
+        self._fetch_worker = self.run_worker(
+            functools.partial(self._fetch_all_repos, min_age), thread=True
+        )
+
+    def _fetch_all_repos(self, min_age: float = 0) -> dict[Path, tuple[bool, str]]:
+        """Background worker to fetch all repositories with progress updates.
 
-    def _fetch_all_repos(self) -> dict[Path, tuple[bool, str]]:
-        """Background worker to fetch all repositories with progress updates."""
-        fetch_status = self.query_one("#fetch-status", Static)
+        Args:
+            min_age: Skip repositories fetched less than this many seconds ago;
+                they keep the result of their previous fetch
+        """
+        fetch_status = self._fetch_status
         repo_paths = self.scanner.find_repositories()
-        total = len(repo_paths)
         results = {}
 
-        for idx, repo_path in enumerate(repo_paths, 1):
-            # Update progress in UI
-            repo_name = repo_path.name
-            self.call_from_thread(
-                fetch_status.update,
-                f"[{self._get_timestamp()}] Fetching {idx}/{total}: {repo_name}...",
-            )
+        if min_age > 0:
+            cutoff = time.time() - min_age
+            fetched_before = [
+                (repo_path, self.scanner.last_fetch_time(repo_path)) for repo_path in repo_paths
+            ]
+            repo_paths = []
+            for repo_path, fetch_time in fetched_before:
+                if fetch_time is not None and fetch_time > cutoff:
+                    results[repo_path] = self._fetch_results.get(
+                        repo_path, (True, "Fetched recently")
+                    )
+                else:
+                    repo_paths.append(repo_path)
+        skipped = len(results)
 
-            # Fetch the repo
-            success, message = self.scanner.fetch_repo(repo_path)
-            results[repo_path] = (success, message)
+        total = len(repo_paths)
+        done = 0
+        last_update = 0.0
+        changed = False
+
+        def fetch(repo_path: Path) -> tuple[tuple[bool, str], bool]:
+            # A fetch that moved no remote branch rewrites FETCH_HEAD with the
+            # same contents; without a FETCH_HEAD to compare, assume a change
+            before = self.scanner.fetch_head(repo_path)
+            result = self.scanner.fetch_repo(repo_path)
+            after = self.scanner.fetch_head(repo_path) if result[0] else before
+            return result, result[0] and (after is None or after != before)
+
+        # Fetches are network-bound, so running several at once overlaps their
+        # round trips; fetch_parallelism rather than the scanner's
+        # MAX_PARALLEL_GIT bounds them, to stay polite to the remote hosts.
+        # Results are only touched from this thread.
+        workers = max(1, min(self.config.fetch_parallelism, total))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(fetch, repo_path): repo_path for repo_path in repo_paths}
+            for future in as_completed(futures):
+                repo_path = futures[future]
+                results[repo_path], repo_changed = future.result()
+                changed = changed or repo_changed
+                done += 1
+
+                # Update progress in UI, skipping updates that would arrive
+                # faster than they can be seen
+                now = time.monotonic()
+                if now - last_update < self.FETCH_PROGRESS_INTERVAL and done != total:
+                    continue
+                last_update = now
+                self.call_from_thread(
+                    fetch_status.update,
+                    f"[{self._get_timestamp()}] Fetched {done}/{total}: {repo_path.name}",
+                )
 
         # Count results
         success_count = sum(1 for success, _ in results.values() if success)
-        fail_count = total - success_count
+        fail_count = len(results) - success_count
 
         # Update final message - keep it concise
         if fail_count == 0:
@@ -303,14 +591,21 @@ class GitMonApp(App[None]):
                 f"[{self._get_timestamp()}] Fetch complete: {success_count} succeeded, {fail_count} failed "
                 f"(hover rows with ✗ for details)"
             )
+        if skipped:
+            final_message += f" ({skipped} fetched recently, skipped)"
 
         self.call_from_thread(fetch_status.update, final_message)
 
         # Store fetch results for display in tracking column (keyed by repo path)
         self._fetch_results = {path: (success, msg) for path, (success, msg) in results.items()}
 
-        # Trigger refresh from main thread
-        self.call_from_thread(self.action_refresh)
+        # Rescan from the main thread if a fetch moved remote branches;
+        # otherwise only the fetch marks change, and the repositories already
+        # scanned can be shown again as they are
+        if changed:
+            self.call_from_thread(self.action_refresh, True)
+        else:
+            self.call_from_thread(self._show_repos)
 
         # Hide fetch status after 5 seconds
         def hide_fetch_status() -> None:
@@ -329,7 +624,7 @@ class GitMonApp(App[None]):
         try:
             self.config.save()
         except (OSError, PermissionError) as e:
-            fetch_status = self.query_one("#fetch-status", Static)
+            fetch_status = self._fetch_status
             fetch_status.update(f"Error saving config: {e}")
             fetch_status.styles.display = "block"
             self.set_timer(3, lambda: setattr(fetch_status.styles, "display", "none"))
@@ -341,12 +636,12 @@ class GitMonApp(App[None]):
             if self._auto_fetch_timer:
                 self._auto_fetch_timer.stop()
             self._auto_fetch_timer = self.set_interval(
-                self.config.auto_fetch_interval, self.action_fetch
+                self.config.auto_fetch_interval, self._auto_fetch
             )
             status_msg = f"Auto-fetch enabled (every {self.config.auto_fetch_interval}s)"
 
-            # Refresh display first to show new status
-            self.action_refresh()
+            # Redisplay first to show new status; nothing needs rescanning
+            self._show_repos()
 
             # Trigger an immediate fetch to populate status indicators
             self.action_fetch()
@@ -357,11 +652,11 @@ class GitMonApp(App[None]):
                 self._auto_fetch_timer = None
             status_msg = "Auto-fetch disabled"
 
-            # Refresh display to update info bar
-            self.action_refresh()
+            # Redisplay to update the info bar and hide the fetch marks
+            self._show_repos()
 
             # Show notification
-            fetch_status = self.query_one("#fetch-status", Static)
+            fetch_status = self._fetch_status
             fetch_status.update(f"[{self._get_timestamp()}] {status_msg}")
             fetch_status.styles.display = "block"
 
@@ -371,18 +666,15 @@ class GitMonApp(App[None]):
 
             self.set_timer(3, hide_notification)
 
-    def _show_repo_info(self, row_index: int) -> None:
-        """Show repository info for the given row index."""
-        hover_info = self.query_one("#hover-info", Static)
+    def _render_hover_text(self, repo: RepoInfo) -> str:
+        """Build the hover information for a repository.
 
-        if row_index < 0 or row_index >= len(self.repos):
-            hover_info.styles.display = "none"
-            return
-
-        # Get the sorted repository list (same order as displayed)
-        sorted_repos = self._get_sorted_repos()
-        repo = sorted_repos[row_index]
+        Args:
+            repo: Repository to describe
 
+        Returns:
+            Text for the hover info widget
+        """
         # Format hover information
         lines = []
 
@@ -406,20 +698,30 @@ class GitMonApp(App[None]):
                 simplified_error = _simplify_fetch_error(error_msg)
                 lines.append(f"Fetch Status: ✗ {simplified_error}")
 
-        hover_text = "\n".join(lines)
+        return "\n".join(lines)
 
-        # Update the widget
-        hover_info.update(hover_text)
+    def _show_repo_info(self, row_index: int) -> None:
+        """Show repository info for the given row index."""
+        hover_info = self._hover_info
+
+        if row_index < 0 or row_index >= len(self._hover_texts):
+            self._hover_row = -1
+            self._hover_text = None
+            hover_info.styles.display = "none"
+            return
+
+        # Hover texts are in the same order as displayed; only touch the
+        # widget when the text actually changes
+        self._hover_row = row_index
+        hover_text = self._hover_texts[row_index]
+        if hover_text != self._hover_text:
+            self._hover_text = hover_text
+            hover_info.update(hover_text)
         hover_info.styles.display = "block"
 
     def on_hoverable_data_table_row_hovered(self, message: HoverableDataTable.RowHovered) -> None:
         """Handle row hover events from the HoverableDataTable."""
-        hover_info = self.query_one("#hover-info", Static)
-
-        if message.row_index < 0 or message.row_index >= len(self.repos):
-            hover_info.styles.display = "none"
-        else:
-            self._show_repo_info(message.row_index)
+        self._show_repo_info(message.row_index)
 
     def _get_editor(self) -> str:
         """Get the editor command to use.
@@ -433,8 +735,6 @@ class GitMonApp(App[None]):
             return editor
 
         # Fall back to common system editors (check which exists)
-        import shutil
-
         for fallback in ["sensible-editor", "editor", "nano", "vi"]:
             if shutil.which(fallback):
                 return fallback
@@ -458,10 +758,18 @@ class GitMonApp(App[None]):
             self._open_editor(str(self.config.config_path))
 
     def _get_timestamp(self) -> str:
-        """Get current timestamp string."""
-        from datetime import datetime
+        """Get current timestamp string.
 
-        return datetime.now().strftime("%H:%M:%S")
+        The string only changes once a second, so it is formatted at most once
+        a second. Called from both the UI thread and the fetch worker, hence
+        the (second, string) pair is replaced as a whole.
+        """
+        now = int(time.time())
+        second, timestamp = self._timestamp
+        if now != second:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self._timestamp = (now, timestamp)
+        return timestamp
 
 
 def run_app(config: Optional[Config] = None) -> None:
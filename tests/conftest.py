@@ -1,27 +1,47 @@
 """Pytest configuration and shared fixtures for gitmon tests."""
 
+import json
+import shutil
 import subprocess
 import tempfile
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 import pytest
 
-from gitmon.config import Config
+from gitmon.config import _DEFAULTS, Config
 from gitmon.scanner import GitCommandRunner
 
 
-@pytest.fixture
-def tmp_git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository for testing.
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point gitmon's cache directory at a per-test temporary location.
 
     Args:
         tmp_path: Pytest's temporary directory fixture
+        monkeypatch: Pytest's monkeypatch fixture
 
     Returns:
-        Path to the temporary git repository
+        Path used as $XDG_CACHE_HOME for the test
     """
-    repo_path = tmp_path / "test_repo"
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a git repository with one commit, once per test session.
+
+    Args:
+        tmp_path_factory: Pytest's session-scoped temporary directory factory
+
+    Returns:
+        Path to the template repository; tests must not modify it
+    """
+    repo_path = tmp_path_factory.mktemp("template") / "test_repo"
     repo_path.mkdir()
 
     # Initialize git repo
@@ -53,6 +73,25 @@ def tmp_git_repo(tmp_path: Path) -> Path:
     return repo_path
 
 
+@pytest.fixture
+def tmp_git_repo(tmp_path: Path, git_repo_template: Path) -> Path:
+    """Create a temporary git repository for testing.
+
+    The repository is a copy of the session's template, which is much cheaper
+    than running git init, config, add and commit for every test.
+
+    Args:
+        tmp_path: Pytest's temporary directory fixture
+        git_repo_template: Template repository to copy
+
+    Returns:
+        Path to the temporary git repository
+    """
+    repo_path = tmp_path / "test_repo"
+    shutil.copytree(git_repo_template, repo_path, symlinks=True)
+    return repo_path
+
+
 @pytest.fixture
 def tmp_git_repo_with_remote(tmp_git_repo: Path, tmp_path: Path) -> Path:
     """Create a git repository with a remote configured.
@@ -81,17 +120,44 @@ def tmp_git_repo_with_remote(tmp_git_repo: Path, tmp_path: Path) -> Path:
     return tmp_git_repo
 
 
+@pytest.fixture(scope="session")
+def default_config_bytes() -> bytes:
+    """Serialize the default config file once for the whole session.
+
+    Returns:
+        Contents of the config file gitmon writes on first run
+    """
+    data = dict(_DEFAULTS, watch_directories=[str(Path.home() / "code")])
+    return json.dumps(data, indent=2).encode()
+
+
+@pytest.fixture
+def config_path(tmp_path: Path, default_config_bytes: bytes) -> Path:
+    """Write a default config file into the test's temporary directory.
+
+    Args:
+        tmp_path: Pytest's temporary directory fixture
+        default_config_bytes: Contents of the default config file
+
+    Returns:
+        Path to the config file
+    """
+    path = tmp_path / "config.json"
+    path.write_bytes(default_config_bytes)
+    return path
+
+
 @pytest.fixture
-def mock_config(tmp_path: Path) -> Config:
+def mock_config(config_path: Path, tmp_path: Path) -> Config:
     """Create a mock Config object for testing.
 
     Args:
+        config_path: Path to a default config file
         tmp_path: Pytest's temporary directory fixture
 
     Returns:
         Config object with test settings
     """
-    config_path = tmp_path / "test_config.json"
     config = Config(config_path)
     config.watch_directories = [str(tmp_path)]
     config.refresh_interval = 1
@@ -104,7 +170,7 @@ def mock_config(tmp_path: Path) -> Config:
 class MockGitRunner:
     """Mock git command runner for testing."""
 
-    def __init__(self, responses: Optional[dict[str, tuple[int, str, str]]] = None):
+    def __init__(self, responses: Optional[Mapping[str, tuple[int, str, str]]] = None):
         """Initialize mock runner with predefined responses.
 
         Args:
@@ -112,33 +178,89 @@ class MockGitRunner:
         """
         self.responses = responses or {}
         self.calls: list[tuple[Path, list[str]]] = []
+        # Response chosen for each command line seen so far, so repeated
+        # commands skip the pattern scan; responses must not change afterwards
+        self._matches: dict[str, Optional[tuple[int, str, str]]] = {}
 
     def run(
-        self, cwd: Path, args: list[str], timeout: int = 5
-    ) -> subprocess.CompletedProcess[str]:
+        self,
+        cwd: Path,
+        args: list[str],
+        timeout: int = 5,
+        env: Optional[dict[str, str]] = None,
+    ) -> subprocess.CompletedProcess[bytes]:
         """Mock git command execution.
 
         Args:
             cwd: Working directory
             args: Command arguments
             timeout: Timeout (ignored in mock)
+            env: Extra environment variables (ignored in mock)
 
         Returns:
-            Mocked CompletedProcess
+            Mocked CompletedProcess with the response text encoded to bytes
         """
         # Record the call
         self.calls.append((cwd, args))
 
-        # Find matching response
+        # Find matching response; the first pattern in declaration order wins
         command_key = " ".join(args)
-        for pattern, (returncode, stdout, stderr) in self.responses.items():
-            if pattern in command_key:
-                return subprocess.CompletedProcess(
-                    args=args, returncode=returncode, stdout=stdout, stderr=stderr
-                )
+        try:
+            response = self._matches[command_key]
+        except KeyError:
+            response = next(
+                (resp for pattern, resp in self.responses.items() if pattern in command_key),
+                None,
+            )
+            self._matches[command_key] = response
+
+        if response is not None:
+            returncode, stdout, stderr = response
+            return subprocess.CompletedProcess(
+                args=args,
+                returncode=returncode,
+                stdout=stdout.encode(),
+                stderr=stderr.encode(),
+            )
 
         # Default response for unmatched commands
-        return subprocess.CompletedProcess(args=args, returncode=0, stdout="", stderr="")
+        return subprocess.CompletedProcess(args=args, returncode=0, stdout=b"", stderr=b"")
+
+
+# Response tables for the mock runner fixtures. They are built once and
+# shared read-only; each test still gets its own runner and call log.
+_DEFAULT_RESPONSES: Mapping[str, tuple[int, str, str]] = MappingProxyType(
+    {
+        "status --porcelain": (
+            0,
+            "# branch.oid 1234567890abcdef1234567890abcdef12345678\n"
+            "# branch.head main\n"
+            "# branch.upstream origin/main\n"
+            "# branch.ab +0 -0\n",  # Clean repo, no divergence
+            "",
+        ),
+        "remote get-url": (0, "git@github.com:testuser/testrepo.git\n", ""),
+        "log origin/HEAD": (0, "Test commit message\n", ""),
+        "fetch --all": (0, "", ""),
+    }
+)
+
+_CHANGES_RESPONSES: Mapping[str, tuple[int, str, str]] = MappingProxyType(
+    {
+        "status --porcelain": (
+            0,
+            "# branch.oid 1234567890abcdef1234567890abcdef12345678\n"
+            "# branch.head feature-branch\n"
+            "# branch.upstream origin/feature-branch\n"
+            "# branch.ab +2 -3\n"  # 2 ahead, 3 behind
+            "1 .M N... 100644 100644 100644 1234567 1234567 modified_file.py\n",  # Modified file
+            "",
+        ),
+        "remote get-url": (0, "git@github.com:testuser/testrepo.git\n", ""),
+        "log origin/HEAD": (0, "Latest remote commit\n", ""),
+        "fetch --all": (0, "", ""),
+    }
+)
 
 
 @pytest.fixture
@@ -148,15 +270,7 @@ def mock_git_runner() -> MockGitRunner:
     Returns:
         MockGitRunner with common git command responses
     """
-    responses = {
-        "branch --show-current": (0, "main\n", ""),
-        "remote get-url": (0, "git@github.com:testuser/testrepo.git\n", ""),
-        "status --porcelain": (0, "", ""),  # Clean repo
-        "rev-list --left-right --count": (0, "0\t0\n", ""),  # No divergence
-        "log origin/HEAD": (0, "Test commit message\n", ""),
-        "fetch --all": (0, "", ""),
-    }
-    return MockGitRunner(responses)
+    return MockGitRunner(_DEFAULT_RESPONSES)
 
 
 @pytest.fixture
@@ -166,12 +280,4 @@ def mock_git_runner_with_changes() -> MockGitRunner:
     Returns:
         MockGitRunner configured to simulate uncommitted changes
     """
-    responses = {
-        "branch --show-current": (0, "feature-branch\n", ""),
-        "remote get-url": (0, "git@github.com:testuser/testrepo.git\n", ""),
-        "status --porcelain": (0, " M modified_file.py\n", ""),  # Modified file
-        "rev-list --left-right --count": (0, "2\t3\n", ""),  # 2 ahead, 3 behind
-        "log origin/HEAD": (0, "Latest remote commit\n", ""),
-        "fetch --all": (0, "", ""),
-    }
-    return MockGitRunner(responses)
+    return MockGitRunner(_CHANGES_RESPONSES)
@@ -23,6 +23,6 @@ def test_mock_config_fixture(mock_config: Config) -> None:
 
 def test_mock_git_runner_fixture(mock_git_runner: GitCommandRunner) -> None:
     """Test that mock_git_runner fixture works."""
-    result = mock_git_runner.run(Path("/tmp"), ["git", "branch", "--show-current"])
+    result = mock_git_runner.run(Path("/tmp"), ["git", "status", "--porcelain=v2", "--branch"])
     assert result.returncode == 0
-    assert "main" in result.stdout
+    assert b"# branch.head main" in result.stdout
@@ -0,0 +1,493 @@
+"""Tests for the Textual application."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pytest
+from gitmon.config import Config
+from gitmon.scanner import RepoInfo
+from gitmon.tui import GitMonApp, HoverableDataTable, _tracking_text
+from rich.text import Text
+from textual.events import AppBlur, AppFocus
+from textual.pilot import Pilot
+from textual.widgets import DataTable, Static
+
+
+def _repo(root: Path, name: str, owner: str = "owner", status: str = "clean") -> RepoInfo:
+    """Create a RepoInfo for a repository under root."""
+    return RepoInfo(
+        name=name,
+        path=root / name,
+        remote_owner=owner,
+        current_branch="main",
+        status=status,
+    )
+
+
+async def _settle(app: GitMonApp, pilot: Pilot[None]) -> None:
+    """Wait for running scans, and any queued after them, to be displayed."""
+    while app._scan_worker is not None:
+        worker = app._scan_worker
+        await worker.wait()
+        await pilot.pause()
+        if app._scan_worker is worker:
+            break
+
+
+async def _refresh(app: GitMonApp, pilot: Pilot[None]) -> None:
+    """Refresh the app and wait until the new scan is displayed."""
+    app.action_refresh(force=True)
+    await _settle(app, pilot)
+
+
+def _record_scans(app: GitMonApp, repos: list[RepoInfo]) -> list[bool]:
+    """Serve the app's scans from the given list, noting each scan in the returned list."""
+    scans: list[bool] = []
+
+    def fake_scan() -> list[RepoInfo]:
+        scans.append(True)
+        return list(repos)
+
+    app.scanner.scan_all = fake_scan  # type: ignore[method-assign]
+    return scans
+
+
+def _run(
+    config: Config,
+    repos: list[RepoInfo],
+    scenario: Callable[[GitMonApp, Pilot[None]], Awaitable[Any]],
+) -> None:
+    """Run a scenario against the app, serving scans from the given list."""
+    app = GitMonApp(config)
+    app.scanner.scan_all = lambda: list(repos)  # type: ignore[method-assign]
+
+    async def main() -> None:
+        async with app.run_test() as pilot:
+            await _settle(app, pilot)
+            await scenario(app, pilot)
+
+    asyncio.run(main())
+
+
+class TestTrackingText:
+    """Test formatting of the tracking column."""
+
+    @pytest.mark.parametrize(
+        ("fetch_status", "ahead", "behind", "expected"),
+        [
+            (None, 0, 0, ""),
+            ("success", 0, 0, "✓"),
+            (None, 2, 0, "↑ 2"),
+            (None, 0, 3, "↓ 3"),
+            ("failed", 2, 3, "✗  ↑ 2  ↓ 3"),
+        ],
+    )
+    def test_parts_in_order(
+        self, fetch_status: Optional[str], ahead: int, behind: int, expected: str
+    ) -> None:
+        """Test that the fetch mark comes first, then divergence, separated by two spaces."""
+        tracking = _tracking_text(fetch_status, ahead, behind)
+        assert str(tracking) == expected
+
+    def test_fetch_mark_is_styled(self) -> None:
+        """Test that only the fetch mark carries a style."""
+        tracking = _tracking_text("failed", 1, 0)
+        assert isinstance(tracking, Text)
+        assert [(span.start, span.end, span.style) for span in tracking.spans] == [(0, 1, "red")]
+
+
+class TestTableUpdates:
+    """Test that refreshes update the repository table in place."""
+
+    def test_changed_status_updates_cell(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that a changed repository updates its cell without rebuilding the table."""
+        repos = [_repo(tmp_path, "alpha"), _repo(tmp_path, "beta")]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            table = app.query_one(DataTable)
+            cleared: list[bool] = []
+            original_clear = table.clear
+
+            def clear(*args: Any, **kwargs: Any) -> Any:
+                cleared.append(True)
+                return original_clear(*args, **kwargs)
+
+            table.clear = clear  # type: ignore[method-assign]
+
+            repos[1].status = "changes"
+            await _refresh(app, pilot)
+
+            assert table.get_cell(str(repos[1].path), "status").plain == "● changes"
+            assert table.row_count == 2
+            assert not cleared
+
+        _run(mock_config, repos, scenario)
+
+    def test_added_and_removed_repositories(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that rows follow repositories appearing and disappearing, in order."""
+        repos = [_repo(tmp_path, "alpha"), _repo(tmp_path, "gamma")]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            table = app.query_one(DataTable)
+
+            repos.append(_repo(tmp_path, "beta"))
+            await _refresh(app, pilot)
+            assert [table.get_row_at(i)[0].plain for i in range(table.row_count)] == [
+                "[owner] alpha",
+                "[owner] beta",
+                "[owner] gamma",
+            ]
+
+            del repos[0]
+            await _refresh(app, pilot)
+            assert table.row_count == 2
+            assert table.get_row_at(0)[0].plain == "[owner] beta"
+
+        _run(mock_config, repos, scenario)
+
+    def test_scan_runs_in_background(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that the table keeps its rows while a slow scan runs, then updates."""
+        repos = [_repo(tmp_path, "alpha")]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            table = app.query_one(DataTable)
+            release = threading.Event()
+
+            def slow_scan() -> list[RepoInfo]:
+                release.wait(5)
+                return [*repos, _repo(tmp_path, "beta")]
+
+            app.scanner.scan_all = slow_scan  # type: ignore[method-assign]
+            app.action_refresh(force=True)
+            await pilot.pause()
+            assert table.row_count == 1
+            assert "Scanning repositories" in str(app.query_one("#info-bar", Static).render())
+
+            release.set()
+            await _settle(app, pilot)
+            assert table.row_count == 2
+
+        _run(mock_config, repos, scenario)
+
+    def test_refreshes_during_scan_are_coalesced(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that refreshes requested while a scan runs lead to a single further scan."""
+        repos = [_repo(tmp_path, "alpha")]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            release = threading.Event()
+            scans: list[bool] = []
+
+            def slow_scan() -> list[RepoInfo]:
+                scans.append(True)
+                release.wait(5)
+                return list(repos)
+
+            app.scanner.scan_all = slow_scan  # type: ignore[method-assign]
+            for _ in range(3):
+                app.action_refresh(force=True)
+            await pilot.pause()
+            assert len(scans) == 1
+
+            release.set()
+            await _settle(app, pilot)
+            assert len(scans) == 2
+
+        mock_config.refresh_interval = 60
+        _run(mock_config, repos, scenario)
+
+    def test_refresh_right_after_scan_is_skipped(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that only forced refreshes and the refresh key rescan right after a scan."""
+        repos = [_repo(tmp_path, "alpha")]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            scans = _record_scans(app, repos)
+            app.REFRESH_COALESCE_WINDOW = 60
+
+            app.action_refresh()
+            await _settle(app, pilot)
+            assert scans == []
+
+            await _refresh(app, pilot)
+            assert scans == [True]
+
+            await pilot.press("r")
+            await _settle(app, pilot)
+            assert scans == [True, True]
+
+        mock_config.refresh_interval = 60
+        _run(mock_config, repos, scenario)
+
+    def test_unfocused_app_skips_timer_refreshes(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that timer refreshes pause while unfocused and catch up on focus."""
+        repos = [_repo(tmp_path, "alpha")]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            scans = _record_scans(app, repos)
+            app.REFRESH_COALESCE_WINDOW = 0
+
+            app.post_message(AppBlur())
+            await pilot.pause()
+            app._refresh_tick()
+            await _settle(app, pilot)
+            assert scans == []
+
+            app._last_scan_time -= mock_config.refresh_interval + 1
+            app.post_message(AppFocus())
+            await pilot.pause()
+            await _settle(app, pilot)
+            assert scans == [True]
+
+        mock_config.refresh_interval = 60
+        _run(mock_config, repos, scenario)
+
+    def test_rows_sorted_by_owner_then_name(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that rows are ordered by owner, then name, ignoring case."""
+        repos = [
+            _repo(tmp_path, "zeta", owner="Alice"),
+            _repo(tmp_path, "alpha", owner="bob"),
+            _repo(tmp_path, "Beta", owner="alice"),
+        ]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            assert [repo.name for repo in app._sorted_repos] == ["Beta", "zeta", "alpha"]
+
+        _run(mock_config, repos, scenario)
+
+
+class TestHover:
+    """Test reporting of the row under the mouse."""
+
+    def test_moves_within_a_row_are_reported_once(
+        self, mock_config: Config, tmp_path: Path
+    ) -> None:
+        """Test that the hovered row is reported once however often the mouse moves in it."""
+        repos = [_repo(tmp_path, "alpha"), _repo(tmp_path, "beta")]
+        # Refreshes re-show the hovered row; keep them out of the way
+        mock_config.refresh_interval = 60
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            shown: list[int] = []
+            original_show = app._show_repo_info
+
+            def show(row_index: int) -> None:
+                shown.append(row_index)
+                original_show(row_index)
+
+            app._show_repo_info = show  # type: ignore[method-assign]
+
+            for x in (2, 4, 6):
+                await pilot.hover(HoverableDataTable, offset=(x, 2))
+            await pilot.pause(0.2)
+            await pilot.hover(HoverableDataTable, offset=(8, 2))
+            await pilot.pause(0.2)
+
+            assert shown == [1]
+            assert "beta" in str(app.query_one("#hover-info").render())
+
+        _run(mock_config, repos, scenario)
+
+    def test_refresh_updates_shown_info(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that a refresh brings the info of the hovered row up to date."""
+        repos = [_repo(tmp_path, "alpha")]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            await pilot.hover(HoverableDataTable, offset=(2, 1))
+            await pilot.pause(0.2)
+            hover_info = app.query_one("#hover-info", Static)
+            assert "(no commit info)" in str(hover_info.render())
+
+            repos[0].remote_commit_message = "Fix the build"
+            await _refresh(app, pilot)
+
+            assert "Last Remote Commit: Fix the build" in str(hover_info.render())
+
+        _run(mock_config, repos, scenario)
+
+
+class TestFetch:
+    """Test fetching all repositories from the app."""
+
+    def test_repositories_are_fetched_concurrently(
+        self, mock_config: Config, tmp_path: Path
+    ) -> None:
+        """Test that fetches overlap and every result is recorded."""
+        repos = [_repo(tmp_path, "alpha"), _repo(tmp_path, "beta")]
+        # Each fetch waits for the other, so this only completes if they run at once
+        barrier = threading.Barrier(len(repos), timeout=5)
+
+        def fetch_repo(repo_path: Path) -> tuple[bool, str]:
+            barrier.wait()
+            return True, "Success"
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            app.scanner.find_repositories = lambda: [repo.path for repo in repos]  # type: ignore[method-assign]
+            app.scanner.fetch_repo = fetch_repo  # type: ignore[method-assign]
+
+            app.action_fetch()
+            assert app._fetch_worker is not None
+            await app._fetch_worker.wait()
+            await pilot.pause()
+
+            assert app._fetch_results == {repo.path: (True, "Success") for repo in repos}
+
+        _run(mock_config, repos, scenario)
+
+    def test_second_fetch_is_refused_while_first_starts(
+        self, mock_config: Config, tmp_path: Path
+    ) -> None:
+        """Test that a fetch requested before the previous one got going is not started."""
+        repos = [_repo(tmp_path, "alpha")]
+        fetched: list[Path] = []
+
+        def fetch_repo(repo_path: Path) -> tuple[bool, str]:
+            fetched.append(repo_path)
+            return True, "Success"
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            app.scanner.find_repositories = lambda: [repo.path for repo in repos]  # type: ignore[method-assign]
+            app.scanner.fetch_repo = fetch_repo  # type: ignore[method-assign]
+
+            app.action_fetch()
+            worker = app._fetch_worker
+            app.action_fetch()
+            assert app._fetch_worker is worker
+            assert worker is not None
+            await worker.wait()
+            await pilot.pause()
+
+            assert fetched == [repos[0].path]
+
+        _run(mock_config, repos, scenario)
+
+    def test_progress_updates_are_throttled(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that quick fetches report progress once at the start and once at the end."""
+        repos = [_repo(tmp_path, f"repo{i}") for i in range(20)]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            app.scanner.find_repositories = lambda: [repo.path for repo in repos]  # type: ignore[method-assign]
+            app.scanner.fetch_repo = lambda repo_path: (True, "Success")  # type: ignore[method-assign]
+            app.FETCH_PROGRESS_INTERVAL = 60
+
+            fetch_status = app.query_one("#fetch-status", Static)
+            updates: list[str] = []
+            fetch_status.update = updates.append  # type: ignore[method-assign,assignment]
+
+            app.action_fetch()
+            assert app._fetch_worker is not None
+            await app._fetch_worker.wait()
+            await pilot.pause()
+
+            progress = [update for update in updates if "Fetched" in update]
+            assert len(progress) == 2
+            assert "Fetched 20/20" in progress[-1]
+            assert "Fetch complete: 20 repos updated" in updates[-1]
+
+        _run(mock_config, repos, scenario)
+
+    def test_auto_fetch_skips_recently_fetched(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that the auto-fetch timer leaves repositories fetched moments ago alone."""
+        repos = [_repo(tmp_path, "alpha"), _repo(tmp_path, "beta")]
+        (repos[0].path / ".git").mkdir(parents=True)
+        (repos[0].path / ".git" / "FETCH_HEAD").touch()
+        fetched: list[Path] = []
+
+        def fetch_repo(repo_path: Path) -> tuple[bool, str]:
+            fetched.append(repo_path)
+            return True, "Success"
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            app.scanner.find_repositories = lambda: [repo.path for repo in repos]  # type: ignore[method-assign]
+            app.scanner.fetch_repo = fetch_repo  # type: ignore[method-assign]
+
+            app._auto_fetch()
+            assert app._fetch_worker is not None
+            await app._fetch_worker.wait()
+            await pilot.pause()
+
+            assert fetched == [repos[1].path]
+            assert set(app._fetch_results) == {repo.path for repo in repos}
+
+        _run(mock_config, repos, scenario)
+
+    def test_failed_fetches_do_not_rescan(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that only the fetch marks are updated when no fetch succeeded."""
+        repos = [_repo(tmp_path, "alpha")]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            scans = _record_scans(app, repos)
+            app.scanner.find_repositories = lambda: [repo.path for repo in repos]  # type: ignore[method-assign]
+            app.scanner.fetch_repo = lambda repo_path: (False, "fatal: unable to access")  # type: ignore[method-assign]
+            app.config.auto_fetch_enabled = True
+
+            app.action_fetch()
+            assert app._fetch_worker is not None
+            await app._fetch_worker.wait()
+            await pilot.pause()
+
+            assert scans == []
+            cell = app.query_one(DataTable).get_cell(str(repos[0].path), "tracking")
+            assert cell.plain == "✗"
+
+        _run(mock_config, repos, scenario)
+
+    @pytest.mark.parametrize("moved", [False, True])
+    def test_rescans_only_when_fetch_moved_refs(
+        self, mock_config: Config, tmp_path: Path, moved: bool
+    ) -> None:
+        """Test that a successful fetch only triggers a rescan if FETCH_HEAD changed."""
+        repos = [_repo(tmp_path, "alpha")]
+        fetch_head = repos[0].path / ".git" / "FETCH_HEAD"
+        fetch_head.parent.mkdir(parents=True)
+        fetch_head.write_text("1111\tbranch 'main' of origin\n")
+
+        def fetch_repo(repo_path: Path) -> tuple[bool, str]:
+            fetch_head.write_text(f"{2222 if moved else 1111}\tbranch 'main' of origin\n")
+            return True, "Success"
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            scans = _record_scans(app, repos)
+            app.scanner.find_repositories = lambda: [repo.path for repo in repos]  # type: ignore[method-assign]
+            app.scanner.fetch_repo = fetch_repo  # type: ignore[method-assign]
+
+            app.action_fetch()
+            assert app._fetch_worker is not None
+            await app._fetch_worker.wait()
+            await _settle(app, pilot)
+
+            assert scans == ([True] if moved else [])
+
+        _run(mock_config, repos, scenario)
+
+
+class TestInfoBar:
+    """Test the summary shown in the info bar."""
+
+    def test_counts_repositories_by_status(self, mock_config: Config, tmp_path: Path) -> None:
+        """Test that each status is counted, and zero counts other than clean are hidden."""
+        repos = [
+            _repo(tmp_path, "alpha"),
+            _repo(tmp_path, "beta", status="changes"),
+            _repo(tmp_path, "gamma", status="changes"),
+            _repo(tmp_path, "delta", status="error"),
+        ]
+
+        async def scenario(app: GitMonApp, pilot: Pilot[None]) -> None:
+            info = str(app.query_one("#info-bar", Static).render())
+
+            assert "Repositories: 4 | Clean: 1 | Changes: 2 | Errors: 1" in info
+            assert "Stashed" not in info
+
+        _run(mock_config, repos, scenario)
+
+    def test_timestamp_format(self, mock_config: Config) -> None:
+        """Test that timestamps are the local time as HH:MM:SS."""
+        app = GitMonApp(mock_config)
+        before = time.strftime("%H:%M:%S")
+        timestamp = app._get_timestamp()
+        after = time.strftime("%H:%M:%S")
+
+        assert timestamp in (before, after)
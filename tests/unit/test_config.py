@@ -2,6 +2,7 @@
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -27,6 +28,7 @@ class TestConfigDefaultCreation:
         assert config.max_depth == 3
         assert config.auto_fetch_enabled is False
         assert config.auto_fetch_interval == 300
+        assert config.fetch_parallelism == 8
 
     def test_creates_parent_directories(self, tmp_path: Path) -> None:
         """Test that parent directories are created if missing."""
@@ -36,20 +38,41 @@ class TestConfigDefaultCreation:
         assert config_path.exists()
         assert config_path.parent.exists()
 
+    def test_default_path_follows_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the default config location is resolved from $HOME at use time."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        config = Config()
+
+        assert config.config_path == tmp_path / ".config" / "gitmon" / "config.json"
+        assert config.config_path.exists()
+
     def test_default_config_has_valid_json(self, tmp_path: Path) -> None:
         """Test that created default config is valid JSON."""
         config_path = tmp_path / "config.json"
         Config(config_path)
 
         # Should be able to load as JSON
-        with open(config_path) as f:
-            data = json.load(f)
+        data = json.loads(config_path.read_bytes())
 
         assert "watch_directories" in data
         assert "refresh_interval" in data
         assert "max_depth" in data
 
 
+class TestConfigAttributes:
+    """Test the Config attribute layout."""
+
+    def test_rejects_unknown_attributes(self, tmp_path: Path) -> None:
+        """Test that misspelled option names fail loudly instead of being ignored."""
+        config = Config(tmp_path / "config.json")
+
+        with pytest.raises(AttributeError):
+            config.refresh_intervall = 10  # type: ignore[attr-defined]
+
+
 class TestConfigLoading:
     """Test loading existing config files."""
 
@@ -122,9 +145,8 @@ class TestConfigLoading:
 class TestConfigSaving:
     """Test config file saving."""
 
-    def test_saves_config_correctly(self, tmp_path: Path) -> None:
+    def test_saves_config_correctly(self, config_path: Path) -> None:
         """Test that config is saved correctly."""
-        config_path = tmp_path / "config.json"
         config = Config(config_path)
 
         # Modify config
@@ -138,8 +160,7 @@ class TestConfigSaving:
         config.save()
 
         # Verify file contents
-        with open(config_path) as f:
-            data = json.load(f)
+        data = json.loads(config_path.read_bytes())
 
         assert data["watch_directories"] == ["/custom/path"]
         assert data["refresh_interval"] == 15
@@ -172,18 +193,62 @@ class TestConfigSaving:
         config.save()
 
         # Verify the file was overwritten
-        with open(config_path) as f:
-            data = json.load(f)
+        data = json.loads(config_path.read_bytes())
 
         assert data["refresh_interval"] == 20
 
+    def test_save_leaves_no_temporary_file(self, tmp_path: Path, config_path: Path) -> None:
+        """Test that saving replaces the config atomically without leftovers."""
+        config = Config(config_path)
+        config.save()
+
+        assert sorted(p.name for p in tmp_path.iterdir() if p.is_file()) == ["config.json"]
+
+    def test_save_keeps_symlinked_config(self, tmp_path: Path) -> None:
+        """Test that saving through a symlink updates its target instead of replacing it."""
+        target = tmp_path / "dotfiles" / "config.json"
+        config_path = tmp_path / "config.json"
+        Config(target)
+        config_path.symlink_to(target)
+
+        config = Config(config_path)
+        config.refresh_interval = 20
+        config.save()
+
+        assert config_path.is_symlink()
+        assert json.loads(target.read_bytes())["refresh_interval"] == 20
+
+    def test_save_keeps_file_mode(self, config_path: Path) -> None:
+        """Test that saving keeps the permissions of an existing config file."""
+        config_path.chmod(0o600)
+        config = Config(config_path)
+
+        config.save()
+
+        assert config_path.stat().st_mode & 0o777 == 0o600
+
+    def test_concurrent_saves_do_not_collide(self, tmp_path: Path, config_path: Path) -> None:
+        """Test that simultaneous saves each write through their own temporary file."""
+        configs = [Config(config_path) for _ in range(8)]
+        for interval, config in enumerate(configs, start=1):
+            config.refresh_interval = interval
+
+        def save_repeatedly(config: Config) -> None:
+            for _ in range(20):
+                config.save()
+
+        with ThreadPoolExecutor(max_workers=len(configs)) as executor:
+            list(executor.map(save_repeatedly, configs))
+
+        assert json.loads(config_path.read_bytes())["refresh_interval"] in range(1, 9)
+        assert sorted(p.name for p in tmp_path.iterdir() if p.is_file()) == ["config.json"]
+
 
 class TestGetExpandedDirectories:
     """Test directory expansion and filtering."""
 
-    def test_expands_tilde_in_paths(self, tmp_path: Path) -> None:
+    def test_expands_tilde_in_paths(self, config_path: Path) -> None:
         """Test that ~ is expanded to home directory."""
-        config_path = tmp_path / "config.json"
         config = Config(config_path)
 
         config.watch_directories = ["~/test"]
@@ -197,14 +262,15 @@ class TestGetExpandedDirectories:
         if expanded:
             assert str(expanded[0]) == str(expected_path)
 
-    def test_expands_environment_variables(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_expands_environment_variables(
+        self, tmp_path: Path, config_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that environment variables are expanded."""
         # Set a test environment variable
         test_dir = tmp_path / "test_env_dir"
         test_dir.mkdir()
         monkeypatch.setenv("TEST_DIR", str(test_dir))
 
-        config_path = tmp_path / "config.json"
         config = Config(config_path)
         config.watch_directories = ["$TEST_DIR"]
 
@@ -213,9 +279,8 @@ class TestGetExpandedDirectories:
         assert len(expanded) == 1
         assert expanded[0] == test_dir
 
-    def test_filters_nonexistent_directories(self, tmp_path: Path) -> None:
+    def test_filters_nonexistent_directories(self, tmp_path: Path, config_path: Path) -> None:
         """Test that non-existent directories are filtered out."""
-        config_path = tmp_path / "config.json"
         config = Config(config_path)
 
         config.watch_directories = [
@@ -231,9 +296,8 @@ class TestGetExpandedDirectories:
         assert len(expanded) == 1
         assert expanded[0] == tmp_path / "exists"
 
-    def test_filters_non_directory_paths(self, tmp_path: Path) -> None:
+    def test_filters_non_directory_paths(self, tmp_path: Path, config_path: Path) -> None:
         """Test that file paths are filtered out."""
-        config_path = tmp_path / "config.json"
         config = Config(config_path)
 
         # Create a file and a directory
@@ -250,9 +314,24 @@ class TestGetExpandedDirectories:
         assert len(expanded) == 1
         assert expanded[0] == dir_path
 
-    def test_handles_empty_watch_directories(self, tmp_path: Path) -> None:
+    def test_reassigning_watch_directories_updates_expansion(
+        self, tmp_path: Path, config_path: Path
+    ) -> None:
+        """Test that expanded directories follow reassignment of watch_directories."""
+        config = Config(config_path)
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        config.watch_directories = [str(first)]
+        assert config.get_expanded_directories() == [first]
+
+        config.watch_directories = [str(second)]
+        assert config.get_expanded_directories() == [second]
+
+    def test_handles_empty_watch_directories(self, config_path: Path) -> None:
         """Test that empty watch_directories returns empty list."""
-        config_path = tmp_path / "config.json"
         config = Config(config_path)
         config.watch_directories = []
 
@@ -347,6 +426,20 @@ class TestConfigValidation:
         with pytest.raises(ConfigurationError, match="auto_fetch_interval must be >= 60"):
             Config(config_path)
 
+    def test_rejects_zero_fetch_parallelism(self, tmp_path: Path) -> None:
+        """Test that fetch_parallelism < 1 raises error."""
+        config_path = tmp_path / "config.json"
+        config_data = {
+            "watch_directories": ["/tmp"],
+            "fetch_parallelism": 0,
+        }
+
+        with open(config_path, "w") as f:
+            json.dump(config_data, f)
+
+        with pytest.raises(ConfigurationError, match="fetch_parallelism must be >= 1"):
+            Config(config_path)
+
     def test_accepts_valid_configuration(self, tmp_path: Path) -> None:
         """Test that valid configuration passes validation."""
         config_path = tmp_path / "config.json"
@@ -356,6 +449,7 @@ class TestConfigValidation:
             "max_depth": 1,
             "auto_fetch_enabled": True,
             "auto_fetch_interval": 60,
+            "fetch_parallelism": 1,
         }
 
         with open(config_path, "w") as f:
@@ -366,3 +460,4 @@ class TestConfigValidation:
         assert config.refresh_interval == 1
         assert config.max_depth == 1
         assert config.auto_fetch_interval == 60
+        assert config.fetch_parallelism == 1
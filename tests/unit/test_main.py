@@ -0,0 +1,74 @@
+"""Unit tests for the command line entry point."""
+
+import logging
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from gitmon.__main__ import _build_parser, main, setup_logging
+
+
+class TestFastPaths:
+    """Test invocations answered without building the argument parser."""
+
+    def test_version_prints_version(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that --version prints the installed version and returns."""
+        monkeypatch.setattr(sys, "argv", ["gitmon", "--version"])
+
+        main()
+
+        assert capsys.readouterr().out.startswith("gitmon ")
+
+
+class TestHelp:
+    """Test the help output."""
+
+    @pytest.mark.parametrize("flag", ["-h", "--help"])
+    def test_help_prints_parser_help(
+        self, flag: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that -h/--help print argparse's help text and exit successfully."""
+        monkeypatch.setattr(sys, "argv", ["gitmon", flag])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out == _build_parser().format_help()
+
+
+class TestSetupLogging:
+    """Test logging configuration."""
+
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self) -> Iterator[None]:
+        """Put the root logger back the way pytest configured it."""
+        root_logger = logging.getLogger()
+        handlers, level = root_logger.handlers[:], root_logger.level
+        yield
+        for handler in root_logger.handlers:
+            handler.close()
+        root_logger.handlers[:] = handlers
+        root_logger.setLevel(level)
+
+    def test_verbose_writes_records_immediately(self, tmp_path: Path) -> None:
+        """Test that --verbose logging reaches the file without waiting for a flush."""
+        log_file = tmp_path / "gitmon.log"
+        setup_logging(logging.INFO, log_file)
+
+        logging.getLogger("gitmon.test").info("scanned")
+
+        assert "scanned" in log_file.read_text()
+
+    def test_debug_flushes_warnings_immediately(self, tmp_path: Path) -> None:
+        """Test that buffered --debug logging still writes warnings at once."""
+        log_file = tmp_path / "gitmon.log"
+        setup_logging(logging.DEBUG, log_file)
+
+        logging.getLogger("gitmon.test").warning("slow scan")
+
+        assert "slow scan" in log_file.read_text()
@@ -0,0 +1,541 @@
+"""Unit tests for scanner module."""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from gitmon.scanner import (
+    AsyncGitRunner,
+    GitScanner,
+    RepoInfo,
+    SubprocessGitRunner,
+    _read_origin_url,
+)
+
+from ..conftest import MockGitRunner
+
+
+def _make_repo(root: Path, name: str) -> Path:
+    """Create a directory that looks like a git repository to the scanner."""
+    repo = root / name
+    (repo / ".git").mkdir(parents=True)
+    return repo
+
+
+class TestRepoInfo:
+    """Test the RepoInfo attribute layout."""
+
+    def test_sort_key_ignores_case(self, tmp_path: Path) -> None:
+        """Test that the sort key is the lowercased owner and name."""
+        info = RepoInfo(
+            name="Repo",
+            path=tmp_path,
+            remote_owner="Owner",
+            current_branch="main",
+            status="clean",
+        )
+
+        assert info.sort_key == ("owner", "repo")
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10")
+    def test_has_no_instance_dict(self, tmp_path: Path) -> None:
+        """Test that RepoInfo instances use slots rather than a per-instance dict."""
+        info = RepoInfo(
+            name="repo",
+            path=tmp_path,
+            remote_owner="owner",
+            current_branch="main",
+            status="clean",
+        )
+
+        assert not hasattr(info, "__dict__")
+        with pytest.raises(AttributeError):
+            info.fetch_state = "success"  # type: ignore[attr-defined]
+
+
+class TestFindRepositories:
+    """Test discovery of repositories under the watch directories."""
+
+    def test_finds_nested_repositories_sorted_by_name(self, tmp_path: Path) -> None:
+        """Test that repositories at several depths are found and sorted."""
+        repos = [
+            _make_repo(tmp_path, "Zeta"),
+            _make_repo(tmp_path / "group", "alpha"),
+            _make_repo(tmp_path / "group" / "sub", "beta"),
+        ]
+
+        found = GitScanner([tmp_path]).find_repositories()
+
+        assert found == sorted(repos, key=lambda p: p.name.lower())
+
+    def test_skips_hidden_and_too_deep_directories(self, tmp_path: Path) -> None:
+        """Test that hidden directories and those beyond max_depth are not searched."""
+        shallow = _make_repo(tmp_path / "a", "shallow")
+        _make_repo(tmp_path / ".hidden", "secret")
+        _make_repo(tmp_path / "a" / "b", "deep")
+
+        found = GitScanner([tmp_path], max_depth=2).find_repositories()
+
+        assert found == [shallow]
+
+    def test_does_not_descend_into_repositories(self, tmp_path: Path) -> None:
+        """Test that repositories nested inside a repository are not reported."""
+        outer = _make_repo(tmp_path, "outer")
+        _make_repo(outer, "inner")
+
+        assert GitScanner([tmp_path]).find_repositories() == [outer]
+
+    def test_searches_every_watch_directory(self, tmp_path: Path) -> None:
+        """Test that repositories from several watch directories are merged and sorted."""
+        roots = [tmp_path / name for name in ("one", "two", "three")]
+        repos = [_make_repo(root, f"repo-{root.name}") for root in roots]
+
+        found = GitScanner(roots).find_repositories()
+
+        assert found == sorted(repos, key=lambda p: p.name.lower())
+
+    def test_same_names_are_ordered_by_path(self, tmp_path: Path) -> None:
+        """Test that repositories sharing a name are ordered by their full path."""
+        second = _make_repo(tmp_path / "b", "API")
+        first = _make_repo(tmp_path / "a", "api")
+
+        assert GitScanner([tmp_path]).find_repositories() == [first, second]
+
+    def test_missing_watch_directory_is_ignored(self, tmp_path: Path) -> None:
+        """Test that a watch directory that does not exist yields no repositories."""
+        assert GitScanner([tmp_path / "missing"]).find_repositories() == []
+
+
+class TestRepositoryListCache:
+    """Test reuse of the repository list between walks."""
+
+    def test_unchanged_tree_is_not_listed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a new scanner reuses the walk of an unchanged tree."""
+        # Keep the tree apart from tmp_path, which also holds the cache directory
+        root = tmp_path / "code"
+        repo = _make_repo(root / "group", "repo")
+        assert GitScanner([root]).find_repositories() == [repo]
+
+        def fail(path: str) -> None:
+            raise AssertionError(f"listed {path}")
+
+        monkeypatch.setattr("gitmon.scanner.os.scandir", fail)
+
+        assert GitScanner([root]).find_repositories() == [repo]
+
+    def test_new_nested_repository_is_found(self, tmp_path: Path) -> None:
+        """Test that a repository added below the top level invalidates the cache."""
+        first = _make_repo(tmp_path / "group", "first")
+        scanner = GitScanner([tmp_path])
+        assert scanner.find_repositories() == [first]
+
+        second = _make_repo(tmp_path / "group", "second")
+
+        assert scanner.find_repositories() == [first, second]
+
+    def test_removed_git_dir_is_noticed(self, tmp_path: Path) -> None:
+        """Test that a directory whose .git was removed is no longer listed."""
+        root = tmp_path / "code"
+        repo = _make_repo(root, "repo")
+        nested = _make_repo(repo, "nested")
+        scanner = GitScanner([root])
+        assert scanner.find_repositories() == [repo]
+
+        (repo / ".git").rmdir()
+
+        assert scanner.find_repositories() == [nested]
+
+    def test_max_depth_change_rewalks(self, tmp_path: Path) -> None:
+        """Test that a walk cached for another max_depth is not reused."""
+        repo = _make_repo(tmp_path / "a" / "b", "deep")
+        assert GitScanner([tmp_path], max_depth=2).find_repositories() == []
+
+        assert GitScanner([tmp_path], max_depth=3).find_repositories() == [repo]
+
+
+class TestGetRepoInfo:
+    """Test extraction of repository information."""
+
+    def test_clean_repo(self, tmp_path: Path, mock_git_runner: MockGitRunner) -> None:
+        """Test parsing of a clean repository with no divergence."""
+        scanner = GitScanner([tmp_path], runner=mock_git_runner)
+
+        info = scanner.get_repo_info(tmp_path)
+
+        assert info.name == "testrepo"
+        assert info.remote_owner == "testuser"
+        assert info.current_branch == "main"
+        assert info.status == "clean"
+        assert (info.ahead, info.behind) == (0, 0)
+        assert info.remote_commit_message == "Test commit message"
+
+    def test_repo_with_changes(
+        self, tmp_path: Path, mock_git_runner_with_changes: MockGitRunner
+    ) -> None:
+        """Test parsing of a dirty repository that has diverged from upstream."""
+        scanner = GitScanner([tmp_path], runner=mock_git_runner_with_changes)
+
+        info = scanner.get_repo_info(tmp_path)
+
+        assert info.current_branch == "feature-branch"
+        assert info.status == "changes"
+        assert (info.ahead, info.behind) == (2, 3)
+
+    def test_detached_head_without_upstream(self, tmp_path: Path) -> None:
+        """Test parsing of a detached HEAD, which has no upstream tracking info."""
+        runner = MockGitRunner(
+            {
+                "status --porcelain": (
+                    0,
+                    "# branch.oid 1234567890abcdef1234567890abcdef12345678\n"
+                    "# branch.head (detached)\n"
+                    "? untracked.txt\n",
+                    "",
+                ),
+            }
+        )
+        scanner = GitScanner([tmp_path], runner=runner)
+
+        info = scanner.get_repo_info(tmp_path)
+
+        assert info.current_branch == "detached HEAD"
+        assert info.status == "changes"
+        assert (info.ahead, info.behind) == (0, 0)
+
+    def test_timeout_marks_repo_as_error(self, tmp_path: Path) -> None:
+        """Test that a timeout on a required command yields an error RepoInfo."""
+
+        class TimeoutRunner(MockGitRunner):
+            def run(
+                self,
+                cwd: Path,
+                args: list[str],
+                timeout: int = 5,
+                env: Optional[dict[str, str]] = None,
+            ) -> subprocess.CompletedProcess[bytes]:
+                raise subprocess.TimeoutExpired(args, timeout)
+
+        scanner = GitScanner([tmp_path], runner=TimeoutRunner())
+
+        info = scanner.get_repo_info(tmp_path)
+
+        assert info.status == "error"
+        assert info.error == "Command timeout"
+
+    def test_queries_skip_optional_locks(self, tmp_path: Path) -> None:
+        """Test that read-only queries run without optional locks or prompts."""
+        envs: list[Optional[dict[str, str]]] = []
+
+        class RecordingRunner(MockGitRunner):
+            def run(
+                self,
+                cwd: Path,
+                args: list[str],
+                timeout: int = 5,
+                env: Optional[dict[str, str]] = None,
+            ) -> subprocess.CompletedProcess[bytes]:
+                envs.append(env)
+                return super().run(cwd, args, timeout, env)
+
+        GitScanner([], runner=RecordingRunner()).get_repo_info(tmp_path)
+
+        assert envs
+        for env in envs:
+            assert env is not None
+            assert env["GIT_OPTIONAL_LOCKS"] == "0"
+            assert env["GIT_TERMINAL_PROMPT"] == "0"
+
+
+class TestRemoteUrlParsing:
+    """Test extraction of owner and repository name from remote URLs."""
+
+    @pytest.mark.parametrize(
+        ("url", "owner", "name"),
+        [
+            ("git@github.com:owner/repo.git", "owner", "repo"),
+            ("git@github.com:owner/repo", "owner", "repo"),
+            ("https://github.com/owner/repo.git", "owner", "repo"),
+            ("https://github.com/owner/repo/", "owner", "repo"),
+            ("ssh://git@example.com:2222/owner/repo.git", "owner", "repo"),
+            ("https://gitlab.com/group/subgroup/repo.git", "subgroup", "repo"),
+            ("git@gitlab.com:group/subgroup/repo.git", "group", "repo"),
+            ("/srv/git/repo.git", "", ""),
+            ("repo", "local", ""),
+            ("", "N/A", ""),
+        ],
+    )
+    def test_owner_and_name(self, url: str, owner: str, name: str) -> None:
+        """Test that each supported URL form yields the expected owner and name."""
+        scanner = GitScanner([])
+
+        assert scanner._extract_owner(url) == owner
+        assert scanner._extract_repo_name(url) == name
+
+
+class TestReadOriginUrl:
+    """Test reading the origin URL without running git."""
+
+    def test_matches_git(self, tmp_git_repo_with_remote: Path) -> None:
+        """Test that the URL read from .git/config is the one git reports."""
+        expected = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            cwd=tmp_git_repo_with_remote,
+            check=True,
+            capture_output=True,
+        ).stdout.strip()
+
+        assert _read_origin_url(tmp_git_repo_with_remote) == expected
+
+    def test_no_origin_is_empty(self, tmp_git_repo: Path) -> None:
+        """Test that a repository without an origin remote has an empty URL."""
+        assert _read_origin_url(tmp_git_repo) == b""
+
+    def test_url_rewriting_defers_to_git(self, tmp_git_repo_with_remote: Path) -> None:
+        """Test that configs git would need to interpret are left to git."""
+        subprocess.run(
+            ["git", "config", "url.https://mirror/.insteadOf", "git@github.com:"],
+            cwd=tmp_git_repo_with_remote,
+            check=True,
+        )
+
+        assert _read_origin_url(tmp_git_repo_with_remote) is None
+
+    def test_global_url_rewriting_defers_to_git(
+        self, tmp_git_repo_with_remote: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that insteadOf rules from the global config are left to git."""
+        global_config = tmp_path / "gitconfig"
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        assert _read_origin_url(tmp_git_repo_with_remote) is not None
+
+        global_config.write_text('[url "https://mirror/"]\n\tinsteadOf = git@github.com:\n')
+
+        assert _read_origin_url(tmp_git_repo_with_remote) is None
+
+    def test_missing_config_defers_to_git(self, tmp_path: Path) -> None:
+        """Test that a repository without a readable config is left to git."""
+        assert _read_origin_url(_make_repo(tmp_path, "repo")) is None
+
+
+class TestScanAll:
+    """Test scanning all repositories."""
+
+    def test_scan_all_preserves_repository_order(
+        self, tmp_path: Path, mock_git_runner: MockGitRunner
+    ) -> None:
+        """Test that concurrent scanning returns results in discovery order."""
+        repos = [_make_repo(tmp_path, name) for name in ("beta", "alpha", "gamma")]
+        scanner = GitScanner([tmp_path], runner=mock_git_runner)
+
+        infos = scanner.scan_all()
+
+        assert [info.path for info in infos] == sorted(repos, key=lambda p: p.name)
+
+    def test_scan_all_inside_running_event_loop(
+        self, tmp_path: Path, mock_git_runner: MockGitRunner
+    ) -> None:
+        """Test that scan_all works when called from code running in an event loop."""
+        _make_repo(tmp_path, "repo")
+        scanner = GitScanner([tmp_path], runner=mock_git_runner)
+
+        async def scan_from_loop() -> int:
+            return len(scanner.scan_all())
+
+        assert asyncio.run(scan_from_loop()) == 1
+
+    def test_async_runner_against_real_repo(self, tmp_git_repo: Path) -> None:
+        """Test the asyncio subprocess runner against a real repository."""
+        scanner = GitScanner([tmp_git_repo.parent], async_runner=AsyncGitRunner())
+
+        (info,) = scanner.scan_all()
+
+        assert info.path == tmp_git_repo
+        assert info.status == "clean"
+        assert info.current_branch
+
+    @pytest.mark.parametrize("use_pygit2", [True, False])
+    def test_rescan_reports_edited_worktree(
+        self, tmp_git_repo: Path, monkeypatch: pytest.MonkeyPatch, use_pygit2: bool
+    ) -> None:
+        """Test that editing a tracked file shows up on the next scan of the same scanner."""
+        if use_pygit2:
+            pytest.importorskip("pygit2")
+        else:
+            monkeypatch.setattr("gitmon.scanner._load_pygit2", lambda: None)
+        scanner = GitScanner([tmp_git_repo.parent])
+
+        assert [info.status for info in scanner.scan_all()] == ["clean"]
+        (tmp_git_repo / "README.md").write_text("# Edited\n")
+        assert [info.status for info in scanner.scan_all()] == ["changes"]
+
+    @pytest.mark.parametrize("use_pygit2", [True, False])
+    def test_repository_removed_after_walk_is_error(
+        self, tmp_git_repo: Path, monkeypatch: pytest.MonkeyPatch, use_pygit2: bool
+    ) -> None:
+        """Test that a repository deleted between the walk and its scan is an error."""
+        if use_pygit2:
+            pytest.importorskip("pygit2")
+        else:
+            monkeypatch.setattr("gitmon.scanner._load_pygit2", lambda: None)
+        scanner = GitScanner([tmp_git_repo.parent])
+        monkeypatch.setattr(scanner, "find_repositories", lambda: [tmp_git_repo])
+        shutil.rmtree(tmp_git_repo)
+
+        assert [info.status for info in scanner.scan_all()] == ["error"]
+        assert (
+            GitScanner([], runner=SubprocessGitRunner()).get_repo_info(tmp_git_repo).status
+            == "error"
+        )
+
+
+class TestStreamedStatus:
+    """Test the default scan path that stops git status at the first entry."""
+
+    def test_dirty_worktree(self, tmp_git_repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a worktree with many changes is reported as changed."""
+        for i in range(2000):
+            (tmp_git_repo / f"untracked_{i}.txt").write_text("new\n")
+        monkeypatch.setattr("gitmon.scanner._load_pygit2", lambda: None)
+
+        (info,) = GitScanner([tmp_git_repo.parent]).scan_all()
+
+        assert info.status == "changes"
+        assert info.current_branch not in ("", "N/A", "detached HEAD")
+
+    def test_missing_remote_head_is_empty(
+        self, tmp_git_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a repository without origin/HEAD gets no remote commit message."""
+        monkeypatch.setattr("gitmon.scanner._load_pygit2", lambda: None)
+
+        info = GitScanner([]).get_repo_info(tmp_git_repo)
+
+        assert info.status == "clean"
+        assert info.remote_commit_message == ""
+
+
+class TestPygit2Backend:
+    """Test reading repository info through libgit2."""
+
+    def test_matches_git_subprocess(self, tmp_git_repo_with_remote: Path) -> None:
+        """Test that pygit2 reports the same info as the git command line."""
+        pytest.importorskip("pygit2")
+        for args in (
+            ["git", "commit", "--allow-empty", "-m", "Wrapped\nsubject\n\nBody"],
+            ["git", "update-ref", "refs/remotes/origin/main", "HEAD"],
+            ["git", "symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/main"],
+        ):
+            subprocess.run(args, cwd=tmp_git_repo_with_remote, check=True, capture_output=True)
+        (tmp_git_repo_with_remote / "README.md").write_text("changed\n")
+        (tmp_git_repo_with_remote / "untracked.txt").write_text("new\n")
+
+        via_libgit2 = GitScanner([]).get_repo_info(tmp_git_repo_with_remote)
+        via_git = GitScanner([], runner=SubprocessGitRunner()).get_repo_info(
+            tmp_git_repo_with_remote
+        )
+
+        assert via_libgit2 == via_git
+        assert via_libgit2.status == "changes"
+        assert via_libgit2.remote_commit_message == "Wrapped subject"
+
+    def test_not_a_repository_is_error(self, tmp_path: Path) -> None:
+        """Test that a directory libgit2 cannot open yields an error RepoInfo."""
+        pytest.importorskip("pygit2")
+
+        info = GitScanner([]).get_repo_info(tmp_path)
+
+        assert info.status == "error"
+
+
+class TestFetchAll:
+    """Test fetching all repositories."""
+
+    def test_fetch_all_returns_result_per_repo(
+        self, tmp_path: Path, mock_git_runner: MockGitRunner
+    ) -> None:
+        """Test that every discovered repository gets a fetch result."""
+        repos = [_make_repo(tmp_path, name) for name in ("one", "two")]
+        scanner = GitScanner([tmp_path], runner=mock_git_runner)
+
+        results = scanner.fetch_all()
+
+        assert results == {repo: (True, "Success") for repo in repos}
+
+    def test_fetch_all_honours_parallelism(
+        self, tmp_path: Path, mock_git_runner: MockGitRunner
+    ) -> None:
+        """Test that fetch_all never runs more fetches at once than asked."""
+        for name in ("one", "two", "three"):
+            _make_repo(tmp_path, name)
+        scanner = GitScanner([tmp_path], runner=mock_git_runner)
+        lock = threading.Lock()
+        running = peak = 0
+
+        def fetch_repo(repo_path: Path) -> tuple[bool, str]:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return True, "Success"
+
+        scanner.fetch_repo = fetch_repo  # type: ignore[method-assign]
+
+        assert len(scanner.fetch_all(parallelism=1)) == 3
+        assert peak == 1
+
+    def test_fetch_prunes_and_limits_stalled_transfers(self, tmp_path: Path) -> None:
+        """Test that fetch_repo runs a parallel, pruning fetch with HTTP stall limits."""
+        seen: list[tuple[list[str], Optional[dict[str, str]]]] = []
+
+        class RecordingRunner(MockGitRunner):
+            def run(
+                self,
+                cwd: Path,
+                args: list[str],
+                timeout: int = 5,
+                env: Optional[dict[str, str]] = None,
+            ) -> subprocess.CompletedProcess[bytes]:
+                seen.append((args, env))
+                return super().run(cwd, args, timeout, env)
+
+        success, _ = GitScanner([], runner=RecordingRunner()).fetch_repo(tmp_path)
+
+        ((args, env),) = seen
+        assert success
+        assert args[:3] == ["git", "fetch", "--all"]
+        assert "--prune" in args
+        assert env is not None and "GIT_HTTP_LOW_SPEED_TIME" in env
+
+
+class TestSubprocessGitRunner:
+    """Test the default synchronous runner."""
+
+    def test_env_extends_current_environment(self, tmp_path: Path) -> None:
+        """Test that extra variables are added to, not substituted for, the environment."""
+        script = "import os; print(os.environ['GITMON_TEST'], 'PATH' in os.environ)"
+
+        result = SubprocessGitRunner().run(
+            tmp_path, [sys.executable, "-c", script], env={"GITMON_TEST": "1"}
+        )
+
+        assert result.stdout.split() == [b"1", b"True"]
+
+    def test_git_runs_in_repository_without_cwd(self, tmp_git_repo: Path) -> None:
+        """Test that git commands rewritten for posix_spawn still run in the repo."""
+        result = SubprocessGitRunner().run(tmp_git_repo, ["git", "rev-parse", "--show-toplevel"])
+
+        assert Path(result.stdout.strip().decode()).resolve() == tmp_git_repo.resolve()
+        assert os.path.isabs(result.args[0])